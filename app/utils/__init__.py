@@ -8,9 +8,13 @@ from .fluent_compat import (
     init_fluent_theme,
     rounded_icon,
 )
+from .layouts import hbox, vbox
 from .qt_env import bootstrap_qt_plugin_paths, configure_qt_plugin_paths
+from .settings_writer import SettingsWriter
+from .tick_bus import TickBus, TickSubscription, tick_bus
 from .ui_scale import (
     AppScaleController,
+    cached_app_scale,
     current_app_scale,
     install_app_scale_controller,
     px,
@@ -21,17 +25,24 @@ __all__ = [
     "AppScaleController",
     "FLUENT_AVAILABLE",
     "FPushButton",
+    "SettingsWriter",
+    "TickBus",
+    "TickSubscription",
     "apply_icon_button_layout",
     "bootstrap_qt_plugin_paths",
     "brand_palette",
+    "cached_app_scale",
     "chat_theme_tokens",
     "configure_qt_plugin_paths",
     "current_app_scale",
     "fluent_icon",
     "focus_theme_base_tokens",
+    "hbox",
     "init_fluent_theme",
     "install_app_scale_controller",
     "px",
     "rounded_icon",
     "screen_scale",
+    "tick_bus",
+    "vbox",
 ]
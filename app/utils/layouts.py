@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Union
+
+from PySide6.QtWidgets import QBoxLayout, QHBoxLayout, QLayout, QVBoxLayout, QWidget
+
+# A row item: a widget, a nested layout, (widget_or_layout, stretch), or an int meaning addStretch(n).
+LayoutItem = Union[QWidget, QLayout, tuple[Union[QWidget, QLayout], int], int]
+
+
+def _fill(layout: QBoxLayout, items: tuple[LayoutItem, ...], spacing: int, margins: tuple[int, int, int, int]) -> None:
+    layout.setContentsMargins(*margins)
+    layout.setSpacing(spacing)
+    for item in items:
+        stretch = 0
+        if isinstance(item, int):
+            layout.addStretch(item)
+            continue
+        if isinstance(item, tuple):
+            item, stretch = item
+        if isinstance(item, QLayout):
+            layout.addLayout(item, stretch)
+        else:
+            layout.addWidget(item, stretch)
+
+
+def hbox(
+    *items: LayoutItem,
+    spacing: int = 0,
+    margins: tuple[int, int, int, int] = (0, 0, 0, 0),
+    parent: QWidget | None = None,
+) -> QHBoxLayout:
+    layout = QHBoxLayout(parent) if parent is not None else QHBoxLayout()
+    _fill(layout, items, spacing, margins)
+    return layout
+
+
+def vbox(
+    *items: LayoutItem,
+    spacing: int = 0,
+    margins: tuple[int, int, int, int] = (0, 0, 0, 0),
+    parent: QWidget | None = None,
+) -> QVBoxLayout:
+    layout = QVBoxLayout(parent) if parent is not None else QVBoxLayout()
+    _fill(layout, items, spacing, margins)
+    return layout
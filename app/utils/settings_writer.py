@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import Any
+
+from PySide6.QtCore import QCoreApplication, QObject, QSettings, QTimer
+
+
+class SettingsWriter(QObject):
+    """
+    Batched front for QSettings.setValue: writes are held for at most `delay_ms` after the first
+    pending change, then applied and synced once. Sliders and playback position can emit many
+    times a second; this keeps them to one disk write per window. The deadline is not pushed back
+    by later writes, so a steady stream (BGM position) cannot starve the flush. Pending values are
+    also flushed when the application is about to quit.
+    """
+
+    def __init__(self, settings: QSettings, parent: QObject | None = None, delay_ms: int = 500) -> None:
+        super().__init__(parent)
+        self._settings = settings
+        self._pending: dict[str, Any] = {}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self.flush)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
+    def set(self, key: str, value: Any) -> None:
+        self._pending[key] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def value(self, key: str, default: Any = None) -> Any:
+        if key in self._pending:
+            return self._pending[key]
+        return self._settings.value(key, default)
+
+    def flush(self) -> None:
+        self._timer.stop()
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for key, value in pending.items():
+            self._settings.setValue(key, value)
+        self._settings.sync()
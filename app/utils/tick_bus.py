@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QCoreApplication, QObject, Qt, QTimer
+
+
+class TickBus(QObject):
+    """
+    One process-wide 1 s timer fanned out to subscribers, instead of a QTimer per window.
+    The timer only runs while someone is subscribed.
+    """
+
+    def __init__(self, parent: QObject | None = None, interval_ms: int = 1000) -> None:
+        super().__init__(parent)
+        self._subs: list[Callable[[], None]] = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        # Countdown is shown at 1 s granularity; let the event loop align wakeups to whole seconds.
+        self._timer.setTimerType(Qt.TimerType.VeryCoarseTimer)
+        self._timer.timeout.connect(self._fire)
+
+    def subscribe(self, callback: Callable[[], None]) -> None:
+        if callback in self._subs:
+            return
+        self._subs.append(callback)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unsubscribe(self, callback: Callable[[], None]) -> None:
+        try:
+            self._subs.remove(callback)
+        except ValueError:
+            return
+        if not self._subs:
+            self._timer.stop()
+
+    def _fire(self) -> None:
+        # Copy: callbacks may unsubscribe themselves while handling the tick.
+        for callback in tuple(self._subs):
+            callback()
+
+
+class TickSubscription:
+    """start()/stop() handle over a TickBus subscription, mirroring the QTimer calls it replaces."""
+
+    def __init__(self, bus: TickBus, callback: Callable[[], None]) -> None:
+        self._bus = bus
+        self._callback = callback
+        self._active = False
+
+    def isActive(self) -> bool:
+        return self._active
+
+    def start(self) -> None:
+        self._active = True
+        self._bus.subscribe(self._callback)
+
+    def stop(self) -> None:
+        self._active = False
+        self._bus.unsubscribe(self._callback)
+
+
+_TICK_BUS: TickBus | None = None
+
+
+def tick_bus() -> TickBus:
+    global _TICK_BUS
+    if _TICK_BUS is None:
+        _TICK_BUS = TickBus(QCoreApplication.instance())
+    return _TICK_BUS
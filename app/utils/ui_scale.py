@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable
 
 from PySide6.QtCore import QCoreApplication, QObject, QTimer
@@ -43,7 +44,32 @@ def current_app_scale(app: QCoreApplication | None) -> float:
     return screen_scale(primary)
 
 
+_SCALE_CACHE: float | None = None
+
+
+def cached_app_scale() -> float:
+    """current_app_scale for the running QApplication, cached until AppScaleController refreshes it."""
+    global _SCALE_CACHE
+    if _SCALE_CACHE is not None:
+        return _SCALE_CACHE
+    app = QApplication.instance()
+    if app is None:
+        return 1.0
+    _SCALE_CACHE = current_app_scale(app)
+    return _SCALE_CACHE
+
+
+def _invalidate_scale_cache() -> None:
+    global _SCALE_CACHE
+    _SCALE_CACHE = None
+
+
 def px(value: int, scale: float) -> int:
+    return _px_cached(value, scale)
+
+
+@lru_cache(maxsize=512)
+def _px_cached(value: int, scale: float) -> int:
     return max(1, int(round(value * scale)))
 
 
@@ -101,6 +127,7 @@ class AppScaleController(QObject):
             # Defensive fallback against transient Qt object lifetimes.
             scale = 1.0
         self._app.setProperty("ui_scale_factor", scale)
+        _invalidate_scale_cache()
         scaled_font = QFont(self._base_font)
         scaled_font.setPointSizeF(self._base_point_size * scale)
         self._app.setFont(scaled_font)
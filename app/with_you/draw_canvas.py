@@ -1,8 +1,10 @@
 """Drawable canvas for sticky-note painting tab."""
 from __future__ import annotations
 
-from PySide6.QtCore import QPoint, Qt
-from PySide6.QtGui import QMouseEvent, QPainter, QPen
+import math
+
+from PySide6.QtCore import QRect, Qt, QTimer
+from PySide6.QtGui import QMouseEvent, QPainter, QPen, QPixmap, QPolygon
 from PySide6.QtWidgets import QWidget
 
 
@@ -10,27 +12,88 @@ class DrawCanvas(QWidget):
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setAttribute(Qt.WidgetAttribute.WA_StaticContents, True)
-        self._strokes: list[list[QPoint]] = []
-        self._current_stroke: list[QPoint] | None = None
+        # paintEvent covers every dirty pixel from the white-filled buffer; skip Qt's background erase.
+        self.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, True)
+        # Finished strokes are baked into _buffer; only the stroke being drawn is kept as points.
+        self._buffer: QPixmap | None = None
+        self._current_stroke: QPolygon | None = None
         self._pen = QPen(Qt.GlobalColor.black, 2, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap)
+        # High-rate mice emit far more moves than the display can show; batch them per frame.
+        self._pending_dirty = QRect()
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_pending_update)
 
     def clear_canvas(self) -> None:
-        self._strokes.clear()
         self._current_stroke = None
+        if self._buffer is not None:
+            self._buffer.fill(Qt.GlobalColor.white)
         self.update()
 
+    def _ensure_buffer(self) -> QPixmap:
+        """Backing store sized to the widget; grows on resize and keeps existing ink."""
+        dpr = self.devicePixelRatioF()
+        # Round up: at fractional DPRs truncation leaves an unpainted edge under WA_OpaquePaintEvent.
+        target_w = max(1, math.ceil(self.width() * dpr))
+        target_h = max(1, math.ceil(self.height() * dpr))
+        old = self._buffer
+        if old is not None and old.width() >= target_w and old.height() >= target_h:
+            return old
+        if old is not None:
+            target_w = max(target_w, old.width())
+            target_h = max(target_h, old.height())
+        buffer = QPixmap(target_w, target_h)
+        buffer.setDevicePixelRatio(dpr)
+        buffer.fill(Qt.GlobalColor.white)
+        if old is not None:
+            painter = QPainter(buffer)
+            painter.drawPixmap(0, 0, old)
+            painter.end()
+        self._buffer = buffer
+        return buffer
+
+    def _commit_stroke(self, stroke: QPolygon) -> None:
+        painter = QPainter(self._ensure_buffer())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(self._pen)
+        if stroke.size() == 1:
+            painter.drawPoint(stroke.at(0))
+        else:
+            painter.drawPolyline(stroke)
+        painter.end()
+
+    def _segment_dirty_rect(self, start, end) -> QRect:
+        pad = int(self._pen.widthF()) + 2
+        return QRect(start, end).normalized().adjusted(-pad, -pad, pad, pad)
+
+    def _schedule_update(self, rect: QRect) -> None:
+        self._pending_dirty = self._pending_dirty.united(rect)
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_pending_update(self) -> None:
+        if self._pending_dirty.isNull():
+            return
+        self.update(self._pending_dirty)
+        self._pending_dirty = QRect()
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
-            self._current_stroke = [event.position().toPoint()]
-            self._strokes.append(self._current_stroke)
+            point = event.position().toPoint()
+            self._current_stroke = QPolygon()
+            self._current_stroke.append(point)
+            self.update(self._segment_dirty_rect(point, point))
             event.accept()
             return
         super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._current_stroke is not None and event.buttons() & Qt.MouseButton.LeftButton:
-            self._current_stroke.append(event.position().toPoint())
-            self.update()
+            point = event.position().toPoint()
+            previous = self._current_stroke.at(self._current_stroke.size() - 1)
+            self._current_stroke.append(point)
+            self._schedule_update(self._segment_dirty_rect(previous, point))
             event.accept()
             return
         super().mouseMoveEvent(event)
@@ -38,20 +101,31 @@ class DrawCanvas(QWidget):
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton and self._current_stroke is not None:
             self._current_stroke.append(event.position().toPoint())
+            stroke = self._current_stroke
             self._current_stroke = None
-            self.update()
+            self._commit_stroke(stroke)
+            self._repaint_timer.stop()
+            self._pending_dirty = QRect()
+            self.update(stroke.boundingRect().adjusted(-4, -4, 4, 4))
             event.accept()
             return
         super().mouseReleaseEvent(event)
 
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._ensure_buffer()
+
     def paintEvent(self, _event) -> None:
+        # Background and finished ink come from the buffer, so there is no fillRect here. Qt already
+        # clips to the dirty region, and a fresh painter is aliased, which is what the live stroke wants
+        # (it is antialiased when committed).
         painter = QPainter(self)
-        painter.fillRect(self.rect(), Qt.GlobalColor.white)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.drawPixmap(0, 0, self._ensure_buffer())
+        stroke = self._current_stroke
+        if stroke is None:
+            return
         painter.setPen(self._pen)
-        for stroke in self._strokes:
-            if len(stroke) == 1:
-                painter.drawPoint(stroke[0])
-                continue
-            for i in range(1, len(stroke)):
-                painter.drawLine(stroke[i - 1], stroke[i])
+        if stroke.size() == 1:
+            painter.drawPoint(stroke.at(0))
+        else:
+            painter.drawPolyline(stroke)
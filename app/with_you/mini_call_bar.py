@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 
-from PySide6.QtCore import QPoint, Qt, Signal
-from PySide6.QtGui import QColor, QKeyEvent, QMouseEvent
+from PySide6.QtCore import QPoint, QRect, QRectF, Qt, QTimer, Signal
+from PySide6.QtGui import QColor, QKeyEvent, QMouseEvent, QPainter, QPaintEvent, QPixmap
 from PySide6.QtWidgets import (
-    QApplication,
     QDialog,
     QFrame,
-    QGraphicsDropShadowEffect,
+    QGraphicsBlurEffect,
+    QGraphicsPixmapItem,
+    QGraphicsScene,
     QHBoxLayout,
     QLabel,
     QPushButton,
@@ -17,22 +19,69 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from app.utils.ui_scale import current_app_scale, px
+from app.utils.ui_scale import cached_app_scale, px
 
 from . import styles
 from .mini_star_overlay import MiniStarOverlay
 
 
+_PANEL_RADIUS = 20
+_SHADOW_COLOR = QColor(31, 44, 59, 38)
+
+
+@lru_cache(maxsize=4)
+def _panel_shadow_pixmap(panel_w: int, panel_h: int, margin: int, blur: int, offset_y: int, dpr: float) -> QPixmap:
+    """
+    Panel drop shadow rendered once per geometry, instead of a live QGraphicsDropShadowEffect.
+    Same blur as the effect (qt_blurImage via QGraphicsBlurEffect), clipped to the panel plus its
+    margins, which is all of it the dialog ever showed.
+    """
+    # Work in device pixels so the blur matches what the effect produced at this DPR.
+    w = max(1, round((panel_w + margin * 2) * dpr))
+    h = max(1, round((panel_h + margin * 2) * dpr))
+    source = QPixmap(w, h)
+    source.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(source)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.scale(dpr, dpr)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(_SHADOW_COLOR)
+    painter.drawRoundedRect(QRect(margin, margin + offset_y, panel_w, panel_h), _PANEL_RADIUS, _PANEL_RADIUS)
+    painter.end()
+
+    item = QGraphicsPixmapItem(source)
+    effect = QGraphicsBlurEffect()
+    effect.setBlurRadius(blur * dpr)
+    effect.setBlurHints(QGraphicsBlurEffect.BlurHint.QualityHint)
+    item.setGraphicsEffect(effect)
+    scene = QGraphicsScene()
+    scene.addItem(item)
+    pixmap = QPixmap(w, h)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    bounds = QRectF(0, 0, w, h)
+    scene.render(painter, bounds, bounds)
+    painter.end()
+    pixmap.setDevicePixelRatio(dpr)
+    return pixmap
+
+
 class MiniCallBar(QDialog):
     expandRequested = Signal()
     chatRequested = Signal()
     pauseRequested = Signal()
     hangupRequested = Signal()
 
+    # Checked in order; the first keyword found in the status text picks the miniState.
+    _KEYWORD_STATE = (("专注", "focus"), ("休息", "break"), ("暂停", "pause"), ("结束", "hangup"))
+
     def __init__(self, parent=None, theme_tokens: dict[str, str] | None = None) -> None:
         super().__init__(parent)
         self._theme_tokens = dict(theme_tokens or styles.mini_call_bar_theme_tokens())
         self._drag_offset: QPoint | None = None
+        # Latest drag target; raw mouse moves are collapsed into one move() per event-loop pass.
+        self._pending_move_pos: QPoint | None = None
+        self._last_status_state: str | None = None
         self.setWindowTitle("通话悬浮条")
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint
@@ -106,14 +155,13 @@ class MiniCallBar(QDialog):
         box.addLayout(btn_row)
         root.addWidget(panel, 1)
 
-        app = QApplication.instance()
-        scale = current_app_scale(app) if app is not None else 1.0
+        scale = cached_app_scale()
         self._scale = scale
-        panel_shadow = QGraphicsDropShadowEffect(panel)
-        panel_shadow.setBlurRadius(px(26, scale))
-        panel_shadow.setOffset(0, px(3, scale))
-        panel_shadow.setColor(QColor(31, 44, 59, 38))
-        panel.setGraphicsEffect(panel_shadow)
+        # Drawn behind the panel from a cached pixmap in paintEvent. A QGraphicsDropShadowEffect
+        # would re-blur the whole panel on every star-overlay frame and countdown change.
+        self._shadow_margin = root.contentsMargins().left()
+        self._shadow_blur = px(26, scale)
+        self._shadow_offset = px(3, scale)
 
         self.setStyleSheet(styles.build_mini_call_bar_stylesheet(scale, self._theme_tokens))
 
@@ -121,16 +169,21 @@ class MiniCallBar(QDialog):
         self.timer_label.setText(text)
 
     def set_status(self, text: str) -> None:
-        self.status_label.setText(text)
         state = "config"
-        if "专注" in text:
-            state = "focus"
-        elif "休息" in text:
-            state = "break"
-        elif "暂停" in text:
-            state = "pause"
-        elif "结束" in text:
-            state = "hangup"
+        for keyword, keyword_state in self._KEYWORD_STATE:
+            if keyword in text:
+                state = keyword_state
+                break
+        self.set_status_state(text, state)
+
+    def set_status_state(self, text: str, state: str) -> None:
+        """Like set_status, for callers that already know the miniState value."""
+        if text != self.status_label.text():
+            self.status_label.setText(text)
+        # Re-polishing re-matches the stylesheet; only needed when the state property changes.
+        if state == self._last_status_state:
+            return
+        self._last_status_state = state
         self.status_label.setProperty("miniState", state)
         style = self.status_label.style()
         if style is not None:
@@ -146,14 +199,23 @@ class MiniCallBar(QDialog):
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._drag_offset is not None and event.buttons() & Qt.MouseButton.LeftButton:
-            self.move(event.globalPosition().toPoint() - self._drag_offset)
+            if self._pending_move_pos is None:
+                QTimer.singleShot(0, self._flush_pending_move)
+            self._pending_move_pos = event.globalPosition().toPoint() - self._drag_offset
             event.accept()
             return
         super().mouseMoveEvent(event)
 
+    def _flush_pending_move(self) -> None:
+        pos = self._pending_move_pos
+        self._pending_move_pos = None
+        if pos is not None:
+            self.move(pos)
+
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
             self._drag_offset = None
+            self._flush_pending_move()
         super().mouseReleaseEvent(event)
 
     def resizeEvent(self, event) -> None:
@@ -162,6 +224,16 @@ class MiniCallBar(QDialog):
             self._star_overlay.setGeometry(self._panel.rect())
             self._star_overlay.lower()
 
+    def paintEvent(self, event: QPaintEvent) -> None:
+        super().paintEvent(event)
+        geo = self._panel.geometry()
+        margin = self._shadow_margin
+        shadow = _panel_shadow_pixmap(
+            geo.width(), geo.height(), margin, self._shadow_blur, self._shadow_offset, self.devicePixelRatioF()
+        )
+        painter = QPainter(self)
+        painter.drawPixmap(geo.x() - margin, geo.y() - margin, shadow)
+
     def keyPressEvent(self, event: QKeyEvent) -> None:
         if event.key() == Qt.Key.Key_Escape:
             event.accept()
@@ -2,15 +2,25 @@
 from __future__ import annotations
 
 from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QApplication, QDialog, QHBoxLayout, QPushButton, QTabWidget, QTextEdit, QVBoxLayout
+from PySide6.QtWidgets import (
+    QDialog,
+    QHBoxLayout,
+    QPushButton,
+    QTabWidget,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
 
-from app.utils.ui_scale import current_app_scale
+from app.utils.ui_scale import cached_app_scale
 
 from . import styles
 from .draw_canvas import DrawCanvas
 
 
 class StickyNoteWindow(QDialog):
+    _DRAW_TAB_INDEX = 1
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle("便利贴")
@@ -21,11 +31,14 @@ class StickyNoteWindow(QDialog):
         root.setContentsMargins(8, 8, 8, 8)
         root.setSpacing(8)
         tabs = QTabWidget(self)
+        self._tabs = tabs
         self._text = QTextEdit(self)
         self._text.setPlaceholderText("在这里记录想法...")
-        self._draw = DrawCanvas(self)
+        # The drawing canvas is created the first time its tab is opened.
+        self._draw: DrawCanvas | None = None
         tabs.addTab(self._text, "文字")
-        tabs.addTab(self._draw, "绘画")
+        tabs.addTab(QWidget(self), "绘画")
+        tabs.currentChanged.connect(self._on_tab_changed)
         root.addWidget(tabs, 1)
 
         btn_row = QHBoxLayout()
@@ -36,10 +49,23 @@ class StickyNoteWindow(QDialog):
         btn_row.addWidget(clear_btn)
         root.addLayout(btn_row)
 
-        app = QApplication.instance()
-        scale = current_app_scale(app) if app is not None else 1.0
+        scale = cached_app_scale()
         self.setStyleSheet(styles.build_sticky_note_stylesheet(scale))
 
+    def _on_tab_changed(self, index: int) -> None:
+        if index != self._DRAW_TAB_INDEX or self._draw is not None:
+            return
+        self._draw = DrawCanvas(self)
+        placeholder = self._tabs.widget(self._DRAW_TAB_INDEX)
+        self._tabs.blockSignals(True)
+        self._tabs.removeTab(self._DRAW_TAB_INDEX)
+        self._tabs.insertTab(self._DRAW_TAB_INDEX, self._draw, "绘画")
+        self._tabs.setCurrentIndex(self._DRAW_TAB_INDEX)
+        self._tabs.blockSignals(False)
+        if placeholder is not None:
+            placeholder.deleteLater()
+
     def _clear_all_content(self) -> None:
         self._text.clear()
-        self._draw.clear_canvas()
+        if self._draw is not None:
+            self._draw.clear_canvas()
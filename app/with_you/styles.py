@@ -1,12 +1,18 @@
 """Focus-mode and mini-call-bar QSS. Isolated from window logic."""
 from __future__ import annotations
 
+from functools import lru_cache
+
 from app.utils.design_tokens import focus_theme_base_tokens
 from app.utils.ui_scale import px
 
 
 def focus_theme_tokens() -> dict[str, str]:
-    """Theme tokens for WithYouWindow focus/config view."""
+    """Theme tokens for WithYouWindow focus/config view (a copy; callers may mutate it)."""
+    return dict(_FOCUS_THEME_TOKENS)
+
+
+def _make_focus_theme_tokens() -> dict[str, str]:
     tokens = {
         "bg_dialog": "#0f141b",
         "text_light": "#e6edf3",
@@ -75,9 +81,22 @@ def focus_theme_tokens() -> dict[str, str]:
     return tokens
 
 
+# The palette is static, so the merged token table is built once at import.
+_FOCUS_THEME_TOKENS = _make_focus_theme_tokens()
+
+
 def build_focus_stylesheet(scale: float) -> str:
     """Build QSS for WithYouWindow (focus/config)."""
-    t = focus_theme_tokens()
+    # Keyed on the exact scale, like px(): rounding it would shift some px() results at odd DPIs.
+    key = float(scale)
+    if key == 1.0:
+        return _DEFAULT_FOCUS_QSS
+    return _build_focus_stylesheet(key)
+
+
+@lru_cache(maxsize=8)
+def _build_focus_stylesheet(scale: float) -> str:
+    t = _FOCUS_THEME_TOKENS
     return f"""
             QDialog {{
                 background: {t["bg_dialog"]};
@@ -280,7 +299,16 @@ def mini_call_bar_theme_tokens() -> dict[str, str]:
 
 def build_mini_call_bar_stylesheet(scale: float, theme_tokens: dict[str, str]) -> str:
     """Build QSS for MiniCallBar."""
-    t = theme_tokens
+    token_items = tuple(sorted(theme_tokens.items()))
+    key = float(scale)
+    if key == 1.0 and token_items == _DEFAULT_MINI_TOKEN_ITEMS:
+        return _DEFAULT_MINI_CALL_BAR_QSS
+    return _build_mini_call_bar_stylesheet(key, token_items)
+
+
+@lru_cache(maxsize=8)
+def _build_mini_call_bar_stylesheet(scale: float, token_items: tuple[tuple[str, str], ...]) -> str:
+    t = dict(token_items)
     return f"""
             QFrame#miniPanel {{
                 background: qlineargradient(x1:0, y1:0, x2:1, y2:1, stop:0 {t["mini_panel_a"]}, stop:1 {t["mini_panel_b"]});
@@ -337,6 +365,14 @@ def build_mini_call_bar_stylesheet(scale: float, theme_tokens: dict[str, str]) -
 
 def build_sticky_note_stylesheet(scale: float) -> str:
     """Build QSS for StickyNoteWindow."""
+    key = float(scale)
+    if key == 1.0:
+        return _DEFAULT_STICKY_NOTE_QSS
+    return _build_sticky_note_stylesheet(key)
+
+
+@lru_cache(maxsize=8)
+def _build_sticky_note_stylesheet(scale: float) -> str:
     return f"""
             QDialog {{
                 background: #fff7fb;
@@ -373,3 +409,11 @@ def build_sticky_note_stylesheet(scale: float) -> str:
                 padding: 6px 10px;
             }}
             """
+
+
+# Default-DPI sheets are built at import; scale 1.0 is the common case and skips formatting entirely.
+_DEFAULT_FOCUS_QSS = _build_focus_stylesheet(1.0)
+_DEFAULT_STICKY_NOTE_QSS = _build_sticky_note_stylesheet(1.0)
+# WithYouWindow hands MiniCallBar the focus tokens, so those are the default to specialize.
+_DEFAULT_MINI_TOKEN_ITEMS = tuple(sorted(_FOCUS_THEME_TOKENS.items()))
+_DEFAULT_MINI_CALL_BAR_QSS = _build_mini_call_bar_stylesheet(1.0, _DEFAULT_MINI_TOKEN_ITEMS)
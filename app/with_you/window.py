@@ -2,22 +2,37 @@ from __future__ import annotations
 
 import json
 import math
+import os
 import random
 import sys
-import time
+import threading
 from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Union, cast
-
-from PySide6.QtCore import QEvent, QPoint, QSettings, QSize, Qt, QTimer, QUrl, Signal
-from PySide6.QtGui import QAction, QCloseEvent, QColor, QIcon, QKeyEvent, QLinearGradient, QMouseEvent, QPainter, QPen, QPixmap, QPainterPath, QRegion
-from PySide6.QtMultimedia import QAudioDevice, QAudioOutput, QMediaPlayer, QMediaDevices, QVideoSink
+from stat import S_ISDIR
+from typing import NamedTuple, Union, cast
+
+from PySide6.QtCore import QElapsedTimer, QEvent, QPoint, QRect, QSettings, QSize, Qt, QTimer, QUrl, Signal
+from PySide6.QtGui import QAction, QCloseEvent, QColor, QFont, QIcon, QImage, QKeyEvent, QLinearGradient, QMouseEvent, QPainter, QPen, QPixmap, QRegion
+from PySide6.QtMultimedia import (
+    QAudioDevice,
+    QAudioOutput,
+    QMediaDevices,
+    QMediaPlayer,
+    QSoundEffect,
+    QVideoFrame,
+    QVideoSink,
+)
 try:
     from PySide6.QtMultimediaWidgets import QVideoWidget as _QVideoWidget
 except Exception:  # noqa: BLE001
     _QVideoWidget = None
+try:
+    # Qt >= 6.10
+    from PySide6.QtMultimedia import QPlaybackOptions as _QPlaybackOptions
+except Exception:  # noqa: BLE001
+    _QPlaybackOptions = None
 from PySide6.QtWidgets import (
-    QApplication,
     QCheckBox,
     QDialog,
     QFrame,
@@ -45,7 +60,10 @@ from PySide6.QtWidgets import (
 from app.utils.fluent_compat import apply_icon_button_layout
 from app.utils.fluent_compat import FPushButton as QPushButton
 from app.utils.fluent_compat import init_fluent_theme
-from app.utils.ui_scale import current_app_scale, px
+from app.utils.layouts import hbox, vbox
+from app.utils.settings_writer import SettingsWriter
+from app.utils.tick_bus import TickSubscription, tick_bus
+from app.utils.ui_scale import cached_app_scale, px
 
 from .aurora import Aurora
 from .draw_canvas import DrawCanvas
@@ -56,12 +74,112 @@ from . import styles
 
 HAS_QVIDEO_WIDGET = _QVideoWidget is not None
 
+# Icon candidate names under resources/icon, first existing file wins.
+CHAT_ICONS = ("chat.png", "chat.PNG", "jumpout.png")
+MINI_ICONS = ("exitfull.png", "expand.png", "fullscreen.jpeg")
+SETTING_ICONS = ("setting.png", "setting.PNG")
+RETURN_ICONS = ("return.png", "return.PNG")
+EXIT_ICONS = ("exit", "exit.png", "exit.PNG", "exitfull.png")
+NOTE_ICONS = ("post-it.png", "post-it.PNG", "notepad.png", "notepad.PNG")
+SKIP_ICONS = ("skip.png", "skip.PNG", "next.png", "next.PNG")
+EXPAND_ICONS = ("expand.png", "fullscreen.jpeg")
+PLAY_ICONS = ("play.png", "play.PNG", "ic_play.png")
+PAUSE_ICONS = ("pause.png", "pause.PNG", "ic_pause.png")
+TRAY_ICONS = ("icon.webp", "icon.png", "icon.PNG")
+
+# Media extensions probed under resources/Call (lookups are case-insensitive).
+_VIDEO_EXTS = (".mov", ".mp4")
+_SFX_EXTS = (".mp3", ".wav")
+_AUDIO_EXTS = frozenset({".mp3", ".m4a", ".wav", ".flac", ".ogg"})
+
+
+def _enlarged_menu_font(base: QFont) -> QFont:
+    """Tray menu font: the default menu font bumped by 2 units."""
+    font = QFont(base)
+    if font.pointSize() > 0:
+        font.setPointSize(font.pointSize() + 2)
+    elif font.pixelSize() > 0:
+        font.setPixelSize(font.pixelSize() + 2)
+    return font
+
+
+@lru_cache(maxsize=128)
+def _load_icon_cached(resources_dir: str, candidates: tuple[str, ...]) -> QIcon | None:
+    icon_dir = Path(resources_dir) / "icon"
+    for name in candidates:
+        candidate = icon_dir / name
+        if candidate.exists():
+            icon = QIcon(str(candidate))
+            if not icon.isNull():
+                return icon
+    return None
+
+
+@lru_cache(maxsize=16)
+def _scan_audio_dir_cached(directory: str, mtime_ns: int) -> tuple[Path, ...]:
+    _ = mtime_ns  # cache key only
+    return tuple(
+        sorted(
+            # Suffix test first: it is a string op, is_file() is a stat.
+            (p for p in Path(directory).iterdir() if p.suffix.lower() in _AUDIO_EXTS and p.is_file()),
+            key=lambda p: p.name.lower(),
+        )
+    )
+
+
+def _read_ahead_files(paths: list[Path], limit: int = 8 << 20) -> None:
+    """Read the head of each file once so the OS page cache holds it before a player opens it."""
+    for path in paths:
+        try:
+            with path.open("rb") as f:
+                remaining = limit
+                while remaining > 0 and f.read(min(remaining, 1 << 20)):
+                    remaining -= 1 << 20
+        except OSError:
+            continue
+
+
+@lru_cache(maxsize=16)
+def _rounded_mask_region(width: int, height: int, radius: int) -> QRegion:
+    """Popup mask for a given size; reopening a popup at the same size reuses the region."""
+    # Two overlapping rects plus four corner ellipses: no Bezier flattening into a polygon.
+    r = max(0, min(radius, width // 2, height // 2))
+    d = r * 2
+    region = QRegion(r, 0, width - d, height).united(QRegion(0, r, width, height - d))
+    for x, y in ((0, 0), (width - d, 0), (0, height - d), (width - d, height - d)):
+        region = region.united(QRegion(x, y, d, d, QRegion.RegionType.Ellipse))
+    return region
+
+
+class _ResumeState(NamedTuple):
+    """Running progress kept while the user is back in the settings view."""
+
+    total_rounds: int
+    current_round: int
+    round_seconds: int
+    break_seconds: int
+    remaining_seconds: int
+    is_break_phase: bool
+    was_paused: bool
+
 
 class WithYouWindow(QDialog):
     callStarted = Signal()
     callEnded = Signal()
     chatRequested = Signal()
 
+    # (is_paused, is_break_phase) -> stage text while running
+    _RUNNING_STAGE = {
+        (True, False): "已暂停",
+        (True, True): "已暂停",
+        (False, True): "休息中",
+        (False, False): "专注中",
+    }
+    _PHASE_STAGE = {"config": "设置中", "hangup": "结束中"}
+    # Mini-bar miniState per stage string; anything else shows the neutral "config" style.
+    _STAGE_MINI_STATE = {"专注中": "focus", "休息中": "break", "已暂停": "pause", "结束中": "hangup"}
+    _STAGE_LINE_FMT = "{} · {}"
+
     def __init__(
         self,
         resources_dir: Path,
@@ -80,13 +198,21 @@ class WithYouWindow(QDialog):
         self._shared_tray_default_menu = shared_tray_default_menu
         self._shared_tray_default_tooltip = shared_tray_default_tooltip or "飞行雪绒：主控菜单"
         self._status_tray_active = False
-        self._call_dir = resources_dir / "Call"
+        # Resolved once; every media/noise/BGM path below is derived from it and already absolute.
+        self._call_dir = (resources_dir / "Call").resolve()
+        self._icon_pause = self._load_icon(PAUSE_ICONS)
+        self._icon_play = self._load_icon(PLAY_ICONS)
         self._note_window: StickyNoteWindow | None = None
+        self._owned_subwindows: list[QWidget] = []
+        self.countdown_label: QLabel | None = None
         self._phase = "idle"  # idle / answering / config / running / hangup
         self._loop_video = False
         self._active_video_widget: QWidget | None = None
         self._active_video_label: QLabel | None = None
-        self._last_frame: QPixmap | None = None
+        self._last_frame: QImage | None = None
+        # (label, target size, aspect mode, frame cacheKey) of the last pixmap pushed to a label.
+        self._last_render_key: tuple | None = None
+        self._last_sync_key: tuple[int, int, int, int] | None = None
         self._total_rounds = 1
         self._current_round = 1
         self._round_seconds = 25 * 60
@@ -97,73 +223,83 @@ class WithYouWindow(QDialog):
         self._status_tray: QSystemTrayIcon | None = None
         self._status_tray_menu: QMenu | None = None
         self._status_tray_stage_action: QAction | None = None
+        # (stage, countdown, tooltip owned) last pushed to the status tray.
+        self._last_tray_state: tuple[str, str, bool] | None = None
+        # Last strings pushed to the round/countdown labels and mini-bar status.
+        self._last_ui: dict[str, str] = {"stage": "", "countdown": "", "round": "", "round_stage": ""}
         self._call_active = False
         self._is_break_phase = False
         self._is_paused = False
         self._break_seconds = 5 * 60
-        self._resume_state: dict[str, int | bool] | None = None
+        self._resume_state: _ResumeState | None = None
         self._break_intro_playing = False
         self._start_intro_playing = False
         self._end_outro_playing = False
         self._cinematic_fill_mode = False
-        self._current_media_source = ""
-        self._last_frame_render_ts = 0.0
-        self._frame_interval_s = 1.0 / 20.0
-        self._fallback_frame_interval_normal_s = 1.0 / 20.0
-        self._fallback_frame_interval_bgm_priority_s = 1.0 / 8.0
+        self._current_media_path: Path | None = None
+        self._media_urls: dict[Path, QUrl] = {}
+        self._frame_clock = QElapsedTimer()
+        self._frame_clock.start()
+        self._next_frame_ms = 0
+        self._pending_frame: QVideoFrame | None = None
+        self._frame_drain_scheduled = False
+        self._frame_interval_ms = 1000 // 20
+        self._fallback_frame_interval_normal_ms = 1000 // 20
+        self._fallback_frame_interval_bgm_priority_ms = 1000 // 8
         self._bgm_ducking_ratio = 0.35
         self._background_audio_paused_for_voice = False
         self._resume_ambient_after_voice = False
         self._resume_bgm_after_voice = False
 
-        self._answer_path = self._pick_media(("answering.mov", "answering.mp4", "answering.MOV", "answering.MP4"))
-        self._hangup_path = self._pick_media(("hangup.mov", "hangup.mp4", "hangup.MOV", "hangup.MP4"))
-        self._break_paths = self._pick_media_candidates(
-            (
-                "break1.mov",
-                "break1.mp4",
-                "break1.MOV",
-                "break1.MP4",
-                "break2.mov",
-                "break2.mp4",
-                "break2.MOV",
-                "break2.MP4",
-                "break3.mov",
-                "break3.mp4",
-                "break3.MOV",
-                "break3.MP4",
-            )
-        )
-        self._start1_path = self._pick_media(("start1.mov", "start1.mp4", "start1.MOV", "start1.MP4"))
-        self._start2_path = self._pick_media(("start2.mov", "start2.mp4", "start2.MOV", "start2.MP4"))
-        self._end_paths = self._pick_media_candidates(
-            (
-                "end.mov",
-                "end.mp4",
-                "end.MOV",
-                "end.MP4",
-                "end2.mov",
-                "end2.mp4",
-                "end2.MOV",
-                "end2.MP4",
-            )
-        )
-        self._start_sfx_path = self._pick_media(("start.mp3", "start.MP3", "start.wav", "start.WAV"))
-        self._withyou_path = self._pick_media(
-            ("withyou.mov", "withyou.mp4", "with_you.mov", "with_you.mp4", "withyou.MOV", "withyou.MP4")
-        )
+        self._media_index = self._index_call_dir()
+        self._answer_path = self._pick_media("answering")
+        self._hangup_path = self._pick_media("hangup")
+        self._break_paths = self._pick_media_candidates("break1", "break2", "break3")
+        self._start1_path = self._pick_media("start1")
+        self._start2_path = self._pick_media("start2")
+        self._end_paths = self._pick_media_candidates("end", "end2")
+        self._start_sfx_path = self._pick_media("start", exts=_SFX_EXTS)
+        self._withyou_path = self._pick_media("withyou", "with_you")
+        for clip in (
+            self._answer_path,
+            self._hangup_path,
+            self._start1_path,
+            self._start2_path,
+            self._start_sfx_path,
+            self._withyou_path,
+            *self._break_paths,
+            *self._end_paths,
+        ):
+            if clip is not None:
+                self._media_url(clip)
         self._noise_dir = self._call_dir / "noise"
         self._bgm_dir = self._call_dir / "bgm"
         self._noise_path: Path | None = self._first_audio_in_dir(self._noise_dir)
+        self._noise_url: QUrl | None = QUrl.fromLocalFile(str(self._noise_path)) if self._noise_path is not None else None
         self._with_you_settings = QSettings("FleetSnowfluff", "WithYou")
+        self._settings_writer = SettingsWriter(self._with_you_settings, self)
         self._config_opacity = self._load_config_opacity()
         self._last_focus_date, self._companion_days, self._companion_streak_days = self._load_companion_stats()
-        self._bgm_playlist: list[str] = []
+        # (source URL, display name) per track, built once per directory scan.
+        self._bgm_playlist: list[tuple[QUrl, str]] = []
         self._bgm_index = 0
-        self._bgm_seek_block = False
         self._bgm_resume_position_ms = 0
         self._bgm_pending_seek_ms = 0
         self._bgm_switching_source = False
+        # True while the user drags the seek slider; position ticks must not fight the drag.
+        self._bgm_seek_block = False
+        # "m:ss" of the current track, formatted once per durationChanged; empty when unknown.
+        self._bgm_duration_str = ""
+        self._last_bgm_label_ms = -1000
+        # Audio preferences live here rather than in the popup widgets, which are built on first open.
+        self._ambient_enabled = True
+        self._ambient_volume = 50
+        self._bgm_enabled = True
+        self._bgm_volume = 60
+        self._bgm_loop = True
+        self._noise_popup: QDialog | None = None
+        self._bgm_popup: QDialog | None = None
+        self._media_prewarmed = False
 
         self.setWindowTitle("通话中")
         self.setWindowFlags(Qt.WindowType.Window | Qt.WindowType.Tool)
@@ -171,6 +307,8 @@ class WithYouWindow(QDialog):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, False)
         self.resize(375, 812)  # 5.8-inch class
         self.setFixedSize(375, 812)
+        # Build the whole widget tree with painting suspended; one relayout/repaint happens at the end.
+        self.setUpdatesEnabled(False)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(0, 0, 0, 0)
@@ -219,52 +357,31 @@ class WithYouWindow(QDialog):
         top_row.setSpacing(8)
         self.status_label = QLabel("番茄钟设置")
         self.status_label.setObjectName("statusLabel")
-        self.round_label = QLabel("第 0/0 轮")
-        self.round_label.setObjectName("roundLabel")
-        self.settings_btn = QPushButton("设置")
-        self.settings_btn.setObjectName("ghostBtn")
-        self.settings_btn.setToolTip("返回番茄钟设置")
-        self.settings_btn.clicked.connect(self._back_to_settings)
-        self.chat_btn = QPushButton("聊天窗口")
-        self.chat_btn.setObjectName("chocoBtn")
-        self.chat_btn.setToolTip("呼出飞讯聊天窗口")
-        self.chat_btn.clicked.connect(self._request_chat_window)
-        self.mini_btn = QPushButton("悬浮条")
-        self.mini_btn.setObjectName("ghostBtn")
-        self.mini_btn.setToolTip("收缩为悬浮条")
-        self.mini_btn.clicked.connect(self._enter_mini_mode)
-        self.exit_btn = QPushButton("退出")
-        self.exit_btn.setObjectName("dangerBtn")
-        self.exit_btn.setToolTip("结束当前通话")
-        self.exit_btn.clicked.connect(self._start_hangup)
+        # Plain-text halves share the roundLabel style; no rich-text layout per update.
+        self.round_label_num = QLabel("第 0/0 轮")
+        self.round_label_num.setObjectName("roundLabel")
+        self.round_label_num.setTextFormat(Qt.TextFormat.PlainText)
+        self.round_label_stage = QLabel("")
+        self.round_label_stage.setObjectName("roundLabel")
+        self.round_label_stage.setTextFormat(Qt.TextFormat.PlainText)
+        self.round_label_stage.setVisible(False)
+        self.settings_btn = self._mk_btn("设置", "ghostBtn", "返回番茄钟设置", self._back_to_settings)
+        self.chat_btn = self._mk_btn("聊天窗口", "chocoBtn", "呼出飞讯聊天窗口", self._request_chat_window)
+        self.mini_btn = self._mk_btn("悬浮条", "ghostBtn", "收缩为悬浮条", self._enter_mini_mode)
+        self.exit_btn = self._mk_btn("退出", "dangerBtn", "结束当前通话", self._start_hangup)
         top_row.addWidget(self.status_label)
         top_row.addStretch(1)
-        top_btn_row = QHBoxLayout()
-        top_btn_row.setContentsMargins(0, 0, 0, 0)
-        top_btn_row.setSpacing(6)
         ui_scale = self._ui_scale()
-        self.mini_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.settings_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        self.exit_btn.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
-        top_btn_h = px(40, ui_scale)
-        top_btn_w = px(44, ui_scale)
-        self.mini_btn.setMinimumHeight(top_btn_h)
-        self.settings_btn.setMinimumHeight(top_btn_h)
-        self.exit_btn.setMinimumHeight(top_btn_h)
-        self.mini_btn.setFixedWidth(top_btn_w)
-        self.settings_btn.setFixedWidth(top_btn_w)
-        self.exit_btn.setFixedWidth(top_btn_w)
-        top_btn_row.addWidget(self.mini_btn, 1)
-        top_btn_row.addWidget(self.settings_btn, 1)
-        top_btn_row.addWidget(self.exit_btn, 1)
-        top_row.addLayout(top_btn_row)
-        round_row = QHBoxLayout()
-        round_row.setContentsMargins(0, 0, 0, 0)
-        round_row.addStretch(1)
-        round_row.addWidget(self.round_label)
-        round_row.addStretch(1)
+        top_btns = (self.mini_btn, self.settings_btn, self.exit_btn)
+        self._size_buttons(
+            top_btns,
+            QSizePolicy.Policy.Fixed,
+            px(40, ui_scale),
+            fixed_width=px(44, ui_scale),
+        )
+        top_row.addLayout(hbox(*((btn, 1) for btn in top_btns), spacing=6))
         top_box.addLayout(top_row)
-        top_box.addLayout(round_row)
+        top_box.addLayout(hbox(1, self.round_label_num, self.round_label_stage, 1, spacing=8))
 
         # Middle: 中间播片/设置，占据剩余空间，高度由 _sync_middle_height 保证不重叠
         # Middle: settings panel OR withyou video panel
@@ -285,9 +402,6 @@ class WithYouWindow(QDialog):
         rounds_card_layout = QVBoxLayout(rounds_card)
         rounds_card_layout.setContentsMargins(10, 8, 10, 8)
         rounds_card_layout.setSpacing(6)
-        rounds_row = QHBoxLayout()
-        rounds_row.setContentsMargins(0, 0, 0, 0)
-        rounds_row.setSpacing(6)
         rounds_label = QLabel("轮次")
         rounds_label.setObjectName("settingFieldLabel")
         rounds_label.setObjectName("roundsFieldLabel")
@@ -296,9 +410,7 @@ class WithYouWindow(QDialog):
         self.rounds_spin.setRange(1, 20)
         self.rounds_spin.setValue(4)
         self.rounds_spin.setObjectName("roundsFieldSpin")
-        rounds_row.addWidget(rounds_label)
-        rounds_row.addWidget(self.rounds_spin, 1)
-        rounds_card_layout.addLayout(rounds_row)
+        rounds_card_layout.addLayout(hbox(rounds_label, (self.rounds_spin, 1), spacing=6))
 
         focus_card = QFrame(self._settings_panel)
         focus_card.setObjectName("settingCard")
@@ -310,9 +422,6 @@ class WithYouWindow(QDialog):
         focus_label.setObjectName("settingFieldLabel")
         focus_label.setObjectName("timeFieldLabel")
         focus_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        focus_time_row = QHBoxLayout()
-        focus_time_row.setContentsMargins(0, 0, 0, 0)
-        focus_time_row.setSpacing(6)
         self.focus_min_spin = QSpinBox(self._settings_panel)
         self.focus_min_spin.setRange(0, 120)
         self.focus_min_spin.setValue(25)
@@ -325,12 +434,10 @@ class WithYouWindow(QDialog):
         focus_min_label.setObjectName("unitLabel")
         focus_sec_label = QLabel("秒")
         focus_sec_label.setObjectName("unitLabel")
-        focus_time_row.addWidget(self.focus_min_spin, 1)
-        focus_time_row.addWidget(focus_min_label)
-        focus_time_row.addWidget(self.focus_sec_spin, 1)
-        focus_time_row.addWidget(focus_sec_label)
         focus_card_layout.addWidget(focus_label)
-        focus_card_layout.addLayout(focus_time_row)
+        focus_card_layout.addLayout(
+            hbox((self.focus_min_spin, 1), focus_min_label, (self.focus_sec_spin, 1), focus_sec_label, spacing=6)
+        )
 
         break_card = QFrame(self._settings_panel)
         break_card.setObjectName("settingCard")
@@ -342,9 +449,6 @@ class WithYouWindow(QDialog):
         break_label.setObjectName("settingFieldLabel")
         break_label.setObjectName("timeFieldLabel")
         break_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        break_time_row = QHBoxLayout()
-        break_time_row.setContentsMargins(0, 0, 0, 0)
-        break_time_row.setSpacing(6)
         self.break_min_spin = QSpinBox(self._settings_panel)
         self.break_min_spin.setRange(0, 60)
         self.break_min_spin.setValue(5)
@@ -357,12 +461,10 @@ class WithYouWindow(QDialog):
         break_min_label.setObjectName("unitLabel")
         break_sec_label = QLabel("秒")
         break_sec_label.setObjectName("unitLabel")
-        break_time_row.addWidget(self.break_min_spin, 1)
-        break_time_row.addWidget(break_min_label)
-        break_time_row.addWidget(self.break_sec_spin, 1)
-        break_time_row.addWidget(break_sec_label)
         break_card_layout.addWidget(break_label)
-        break_card_layout.addLayout(break_time_row)
+        break_card_layout.addLayout(
+            hbox((self.break_min_spin, 1), break_min_label, (self.break_sec_spin, 1), break_sec_label, spacing=6)
+        )
         settings_rows.addWidget(rounds_card, 1)
         settings_rows.addWidget(focus_card, 1)
         settings_rows.addWidget(break_card, 1)
@@ -373,9 +475,6 @@ class WithYouWindow(QDialog):
         opacity_card_layout.setSpacing(6)
         opacity_label = QLabel("设置窗口透明度")
         opacity_label.setObjectName("settingFieldLabel")
-        opacity_row = QHBoxLayout()
-        opacity_row.setContentsMargins(0, 0, 0, 0)
-        opacity_row.setSpacing(6)
         self._config_opacity_slider = QSlider(Qt.Orientation.Horizontal, self._settings_panel)
         self._config_opacity_slider.setRange(80, 100)
         self._config_opacity_slider.setValue(self._config_opacity)
@@ -383,34 +482,20 @@ class WithYouWindow(QDialog):
         self._config_opacity_value_label = QLabel(f"{self._config_opacity}%")
         self._config_opacity_value_label.setObjectName("settingFieldLabel")
         self._config_opacity_value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        opacity_row.addWidget(self._config_opacity_slider, 1)
-        opacity_row.addWidget(self._config_opacity_value_label)
         opacity_card_layout.addWidget(opacity_label)
-        opacity_card_layout.addLayout(opacity_row)
+        opacity_card_layout.addLayout(
+            hbox((self._config_opacity_slider, 1), self._config_opacity_value_label, spacing=6)
+        )
         settings_rows.addWidget(opacity_card, 1)
         self._refresh_companion_labels()
 
-        self.start_btn = QPushButton("开始专注")
-        self.start_btn.setObjectName("primaryBtn")
-        self.start_btn.setToolTip("开始番茄钟计时")
-        self.start_btn.clicked.connect(self._start_focus)
-        self.return_btn = QPushButton("返回")
-        self.return_btn.setObjectName("ghostBtn")
-        self.return_btn.setToolTip("返回当前计时进度（不应用本次修改）")
-        self.return_btn.clicked.connect(self._return_to_running_without_changes)
+        self.start_btn = self._mk_btn("开始专注", "primaryBtn", "开始番茄钟计时", self._start_focus)
+        self.return_btn = self._mk_btn("返回", "ghostBtn", "返回当前计时进度（不应用本次修改）", self._return_to_running_without_changes)
         self.return_btn.setVisible(False)
         settings_layout.addLayout(settings_rows, 1)
-        settings_actions = QHBoxLayout()
-        settings_actions.setContentsMargins(0, 0, 0, 0)
-        settings_actions.setSpacing(10)
-        self.return_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.start_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        action_btn_h = px(42, ui_scale)
-        self.return_btn.setMinimumHeight(action_btn_h)
-        self.start_btn.setMinimumHeight(action_btn_h)
-        settings_actions.addWidget(self.return_btn, 1)
-        settings_actions.addWidget(self.start_btn, 1)
-        settings_layout.addLayout(settings_actions)
+        action_btns = (self.return_btn, self.start_btn)
+        self._size_buttons(action_btns, QSizePolicy.Policy.Expanding, px(42, ui_scale))
+        settings_layout.addLayout(hbox(*((btn, 1) for btn in action_btns), spacing=10))
 
         self._settings_scroll = QScrollArea(self._interactive_page)
         self._settings_scroll.setObjectName("settingsScroll")
@@ -444,49 +529,23 @@ class WithYouWindow(QDialog):
         bottom_box.setSpacing(8)
         self.countdown_label = QLabel("00:00")
         self.countdown_label.setObjectName("countdownLabel")
-        self._noise_btn = QPushButton("噪声", bottom_bar)
-        self._noise_btn.setObjectName("ghostBtn")
-        self._noise_btn.setToolTip("背景噪声开关与音量")
-        self._noise_btn.clicked.connect(self._open_noise_popup)
-        self._bgm_btn = QPushButton("BGM", bottom_bar)
-        self._bgm_btn.setObjectName("ghostBtn")
-        self._bgm_btn.setToolTip("背景音乐开关与音量")
-        self._bgm_btn.clicked.connect(self._open_bgm_popup)
-        self.note_btn = QPushButton("便利贴")
-        self.note_btn.setObjectName("chocoBtn")
-        self.note_btn.setToolTip("打开便利贴")
-        self.note_btn.clicked.connect(self._open_note_window)
-        self.pause_btn = QPushButton("暂停")
-        self.pause_btn.setObjectName("chocoBtn")
-        self.pause_btn.setToolTip("暂停或继续计时")
-        self.pause_btn.clicked.connect(self._toggle_pause)
-        self.skip_btn = QPushButton("跳过")
-        self.skip_btn.setObjectName("chocoBtn")
-        self.skip_btn.setToolTip("跳过当前环节")
-        self.skip_btn.clicked.connect(self._skip_current_stage)
+        self._noise_btn = self._mk_btn("噪声", "ghostBtn", "背景噪声开关与音量", self._open_noise_popup, parent=bottom_bar)
+        self._bgm_btn = self._mk_btn("BGM", "ghostBtn", "背景音乐开关与音量", self._open_bgm_popup, parent=bottom_bar)
+        self.note_btn = self._mk_btn("便利贴", "chocoBtn", "打开便利贴", self._open_note_window)
+        self.pause_btn = self._mk_btn("暂停", "chocoBtn", "暂停或继续计时", self._toggle_pause)
+        self.skip_btn = self._mk_btn("跳过", "chocoBtn", "跳过当前环节", self._skip_current_stage)
         timer_wrap = QWidget(bottom_bar)
-        timer_row = QHBoxLayout(timer_wrap)
-        timer_row.setContentsMargins(0, 0, 0, 0)
-        timer_row.setSpacing(8)
-        timer_row.addWidget(self._noise_btn)
-        timer_row.addStretch(1)
-        timer_row.addWidget(self.countdown_label)
-        timer_row.addStretch(1)
-        timer_row.addWidget(self._bgm_btn)
+        hbox(self._noise_btn, 1, self.countdown_label, 1, self._bgm_btn, spacing=8, parent=timer_wrap)
 
         buttons_grid = QGridLayout()
         buttons_grid.setContentsMargins(2, 2, 2, 2)
         buttons_grid.setHorizontalSpacing(8)
         buttons_grid.setVerticalSpacing(8)
-        self.chat_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.pause_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.skip_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.note_btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        choco_h = px(44, ui_scale)
-        self.chat_btn.setMinimumHeight(choco_h)
-        self.pause_btn.setMinimumHeight(choco_h)
-        self.skip_btn.setMinimumHeight(choco_h)
-        self.note_btn.setMinimumHeight(choco_h)
+        self._size_buttons(
+            (self.chat_btn, self.pause_btn, self.skip_btn, self.note_btn),
+            QSizePolicy.Policy.Expanding,
+            px(44, ui_scale),
+        )
         buttons_grid.addWidget(self.chat_btn, 0, 0)
         buttons_grid.addWidget(self.pause_btn, 0, 1)
         buttons_grid.addWidget(self.skip_btn, 1, 0)
@@ -507,25 +566,28 @@ class WithYouWindow(QDialog):
         self._audio.setVolume(1.0)
         self._player = QMediaPlayer(self)
         self._player.setAudioOutput(self._audio)
-        self._sfx_audio = QAudioOutput(self)
-        self._sfx_audio.setVolume(1.0)
-        self._sfx_player = QMediaPlayer(self)
-        self._sfx_player.setAudioOutput(self._sfx_audio)
-        self._ambient_audio = QAudioOutput(self)
-        _default_out = QMediaDevices.defaultAudioOutput()
-        if not _default_out.isNull():
-            self._ambient_audio.setDevice(_default_out)
-        self._ambient_player = QMediaPlayer(self)
-        self._ambient_player.setAudioOutput(self._ambient_audio)
-        self._ambient_player.mediaStatusChanged.connect(self._on_ambient_status_changed)
-        self._bgm_audio = QAudioOutput(self)
-        if not _default_out.isNull():
-            self._bgm_audio.setDevice(_default_out)
-        self._bgm_player = QMediaPlayer(self)
-        self._bgm_player.setAudioOutput(self._bgm_audio)
-        self._bgm_player.positionChanged.connect(self._on_bgm_position_changed)
-        self._bgm_player.durationChanged.connect(self._on_bgm_duration_changed)
-        self._bgm_player.mediaStatusChanged.connect(self._on_bgm_media_status_changed)
+        # Start SFX is loaded once; each trigger only rewinds and plays.
+        # WAV goes through QSoundEffect (preloaded PCM, no demuxer); anything else
+        # still needs a QMediaPlayer since QSoundEffect only decodes WAV.
+        self._sfx_effect: QSoundEffect | None = None
+        self._sfx_player: QMediaPlayer | None = None
+        if self._start_sfx_path is not None:
+            if self._start_sfx_path.suffix.lower() == ".wav":
+                self._sfx_effect = QSoundEffect(self)
+                self._sfx_effect.setVolume(1.0)
+                self._sfx_effect.setSource(self._media_url(self._start_sfx_path))
+            else:
+                self._sfx_audio = QAudioOutput(self)
+                self._sfx_audio.setVolume(1.0)
+                self._sfx_player = QMediaPlayer(self)
+                self._sfx_player.setAudioOutput(self._sfx_audio)
+                self._sfx_player.setSource(self._media_url(self._start_sfx_path))
+        # Ambient/BGM players are created on first start; many sessions never enable either.
+        self._ambient_audio: QAudioOutput | None = None
+        self._ambient_player: QMediaPlayer | None = None
+        self._bgm_audio: QAudioOutput | None = None
+        self._bgm_player: QMediaPlayer | None = None
+        self._default_audio_out: QAudioDevice | None = None
         self._sink: QVideoSink | None = None
         if HAS_QVIDEO_WIDGET:
             self._player.setVideoOutput(self._withyou_video)
@@ -536,113 +598,116 @@ class WithYouWindow(QDialog):
             self._sink = sink
             self._player.setVideoOutput(sink)
             self._active_video_label = cast(QLabel, self._withyou_video)
+        self._oneshot_playback_options = None
+        self._loop_playback_options = None
+        if _QPlaybackOptions is not None and hasattr(self._player, "setPlaybackOptions"):
+            # One-shot intro/break/end/hangup clips are short local files: trade pre-roll probing for latency.
+            oneshot = _QPlaybackOptions()
+            oneshot.setPlaybackIntent(_QPlaybackOptions.PlaybackIntent.LowLatencyStreaming)
+            oneshot.setProbeSize(32 * 1024)
+            self._oneshot_playback_options = oneshot
+            # The looped withyou clip keeps the default profile for glitch-free looping.
+            self._loop_playback_options = _QPlaybackOptions()
         self._player.mediaStatusChanged.connect(self._on_media_status_changed)
         self._player.errorOccurred.connect(self._on_media_error)
         self._player.playbackStateChanged.connect(self._on_video_playback_state_changed)
         self._refresh_video_priority_for_bgm()
 
-        self._tick = QTimer(self)
-        self._tick.setInterval(1000)
-        self._tick.timeout.connect(self._on_tick)
+        self._tick = TickSubscription(tick_bus(), self._on_tick)
+        # Drag-resizes fire many resizeEvents; render the fallback video frame once they settle.
+        self._resize_render_timer = QTimer(self)
+        self._resize_render_timer.setSingleShot(True)
+        self._resize_render_timer.setInterval(16)
+        self._resize_render_timer.timeout.connect(self._render_frame)
         self._apply_icon_buttons()
-        app = QApplication.instance()
-        scale = current_app_scale(app) if app is not None else 1.0
+        scale = cached_app_scale()
         self._apply_soft_shadow(rounds_card, px(22, scale), px(2, scale), alpha=30)
         self._apply_soft_shadow(focus_card, px(22, scale), px(2, scale), alpha=30)
         self._apply_soft_shadow(break_card, px(22, scale), px(2, scale), alpha=30)
 
         self.setStyleSheet(styles.build_focus_stylesheet(scale))
-        self._build_noise_popup()
-        self._build_bgm_popup()
         self._set_view_mode("config")
         self._load_ambient_state()
         self._load_bgm_state()
+        self.setUpdatesEnabled(True)
+
+    def _mk_btn(self, text: str, obj: str, tip: str, slot, *, parent: QWidget | None = None) -> QtPushButton:
+        btn = QPushButton(text, parent) if parent is not None else QPushButton(text)
+        btn.setObjectName(obj)
+        btn.setToolTip(tip)
+        btn.clicked.connect(slot)
+        return btn
+
+    @staticmethod
+    def _size_buttons(
+        buttons: tuple[QtPushButton, ...],
+        h_policy: QSizePolicy.Policy,
+        min_height: int,
+        *,
+        fixed_width: int | None = None,
+    ) -> None:
+        for btn in buttons:
+            btn.setSizePolicy(h_policy, QSizePolicy.Policy.Fixed)
+            btn.setMinimumHeight(min_height)
+            if fixed_width is not None:
+                btn.setFixedWidth(fixed_width)
 
     def _ui_scale(self) -> float:
-        app = QApplication.instance()
-        return current_app_scale(app) if app is not None else 1.0
+        return cached_app_scale()
 
-    def _load_ambient_state(self) -> None:
-        enabled = self._with_you_settings.value("ambient/enabled", True)
-        if isinstance(enabled, bool):
-            self._ambient_enabled_cb.setChecked(enabled)
-        else:
-            self._ambient_enabled_cb.setChecked(enabled not in (0, "0", "false", "no"))
-        vol = self._with_you_settings.value("ambient/volume", 50)
-        v = 50
+    def _setting_int(self, key: str, default: int, lo: int | None = None, hi: int | None = None) -> int:
+        """Read an int setting (QSettings may hand back str), falling back to default, then clamp."""
+        raw = self._settings_writer.value(key, default)
+        value = default
         try:
-            if vol is not None:
-                v = int(cast(Union[int, str], vol))
+            if raw is not None:
+                value = int(cast(Union[int, str], raw))
         except (TypeError, ValueError):
-            pass
-        self._ambient_volume_slider.setValue(max(0, min(100, v)))
-        self._on_ambient_volume_changed(self._ambient_volume_slider.value())
+            value = default
+        if hi is not None:
+            value = min(hi, value)
+        if lo is not None:
+            value = max(lo, value)
+        return value
+
+    def _setting_bool(self, key: str, default: bool) -> bool:
+        """Read a bool setting; INI backends store it as "true"/"false" strings."""
+        raw = self._settings_writer.value(key, default)
+        if isinstance(raw, bool):
+            return raw
+        return str(raw).lower() not in ("0", "false", "no")
+
+    def _load_ambient_state(self) -> None:
+        self._ambient_enabled = self._setting_bool("ambient/enabled", True)
+        self._ambient_volume = self._setting_int("ambient/volume", 50, 0, 100)
 
     def _save_ambient_state(self) -> None:
-        self._with_you_settings.setValue("ambient/enabled", self._ambient_enabled_cb.isChecked())
-        self._with_you_settings.setValue("ambient/volume", self._ambient_volume_slider.value())
+        self._settings_writer.set("ambient/enabled", self._ambient_enabled)
+        self._settings_writer.set("ambient/volume", self._ambient_volume)
 
     def _load_bgm_state(self) -> None:
         self._refresh_bgm_playlist()
-        enabled_bgm = self._with_you_settings.value("bgm/enabled", True)
-        if isinstance(enabled_bgm, bool):
-            self._bgm_enabled_cb.setChecked(enabled_bgm)
-        else:
-            self._bgm_enabled_cb.setChecked(enabled_bgm not in (0, "0", "false", "no"))
-        vol_bgm = self._with_you_settings.value("bgm/volume", 60)
-        v_bgm = 60
-        try:
-            if vol_bgm is not None:
-                v_bgm = int(cast(Union[int, str], vol_bgm))
-        except (TypeError, ValueError):
-            pass
-        self._bgm_volume_slider.setValue(max(0, min(100, v_bgm)))
-        self._on_bgm_volume_changed(self._bgm_volume_slider.value())
-        loop = self._with_you_settings.value("bgm/loop", True)
-        self._bgm_loop_cb.setChecked(loop if isinstance(loop, bool) else str(loop).lower() not in ("0", "false", "no"))
-        idx_raw = self._with_you_settings.value("bgm/index", 0)
-        idx_int = 0
-        try:
-            if idx_raw is not None:
-                idx_int = int(cast(Union[int, str], idx_raw))
-        except (TypeError, ValueError):
-            pass
-        self._bgm_index = max(0, min(len(self._bgm_playlist) - 1, idx_int))
-        pos_raw = self._with_you_settings.value("bgm/position_ms", 0)
-        pos_int = 0
-        try:
-            if pos_raw is not None:
-                pos_int = int(cast(Union[int, str], pos_raw))
-        except (TypeError, ValueError):
-            pos_int = 0
-        self._bgm_resume_position_ms = max(0, pos_int)
-        if self._bgm_playlist:
-            self._bgm_list.blockSignals(True)
-            self._bgm_list.setCurrentRow(self._bgm_index)
-            self._bgm_list.blockSignals(False)
+        self._bgm_enabled = self._setting_bool("bgm/enabled", True)
+        self._bgm_volume = self._setting_int("bgm/volume", 60, 0, 100)
+        self._bgm_loop = self._setting_bool("bgm/loop", True)
+        self._bgm_index = self._setting_int("bgm/index", 0, 0, len(self._bgm_playlist) - 1)
+        self._bgm_resume_position_ms = self._setting_int("bgm/position_ms", 0, 0)
 
     def _save_bgm_state(self) -> None:
-        self._with_you_settings.setValue("bgm/enabled", self._bgm_enabled_cb.isChecked())
-        self._with_you_settings.setValue("bgm/volume", self._bgm_volume_slider.value())
-        self._with_you_settings.setValue("bgm/loop", self._bgm_loop_cb.isChecked())
-        self._with_you_settings.setValue("bgm/index", self._bgm_index)
-        current_pos = self._bgm_player.position()
-        self._with_you_settings.setValue("bgm/position_ms", max(0, current_pos if current_pos > 0 else self._bgm_resume_position_ms))
+        self._settings_writer.set("bgm/enabled", self._bgm_enabled)
+        self._settings_writer.set("bgm/volume", self._bgm_volume)
+        self._settings_writer.set("bgm/loop", self._bgm_loop)
+        self._settings_writer.set("bgm/index", self._bgm_index)
+        current_pos = self._bgm_player.position() if self._bgm_player is not None else 0
+        self._settings_writer.set("bgm/position_ms", max(0, current_pos if current_pos > 0 else self._bgm_resume_position_ms))
 
     def _load_config_opacity(self) -> int:
-        raw = self._with_you_settings.value("window/config_opacity", 100)
-        value = 100
-        try:
-            if raw is not None:
-                value = int(cast(Union[int, str], raw))
-        except (TypeError, ValueError):
-            value = 100
-        return max(80, min(100, value))
+        return self._setting_int("window/config_opacity", 100, 80, 100)
 
     def _on_config_opacity_changed(self, value: int) -> None:
         self._config_opacity = max(80, min(100, int(value)))
         self._config_opacity_value_label.setText(f"{self._config_opacity}%")
-        self._with_you_settings.setValue("window/config_opacity", self._config_opacity)
+        self._settings_writer.set("window/config_opacity", self._config_opacity)
         if self.property("viewMode") == "config":
             self.setWindowOpacity(self._config_opacity / 100.0)
 
@@ -719,16 +784,19 @@ class WithYouWindow(QDialog):
         self._refresh_companion_labels()
 
     def _on_ambient_enabled_changed(self, _state: int) -> None:
+        self._ambient_enabled = self._ambient_enabled_cb.isChecked()
         self._save_ambient_state()
-        if self._ambient_enabled_cb.isChecked():
+        if self._ambient_enabled:
             if self._phase == "running":
                 self._start_ambient()
         else:
             self._stop_ambient()
 
     def _on_ambient_volume_changed(self, value: int) -> None:
-        self._ambient_audio.setVolume(value / 100.0)
-        self._with_you_settings.setValue("ambient/volume", value)
+        self._ambient_volume = value
+        if self._ambient_audio is not None:
+            self._ambient_audio.setVolume(value / 100.0)
+        self._settings_writer.set("ambient/volume", value)
 
     def _on_ambient_status_changed(self, status) -> None:
         if status == QMediaPlayer.MediaStatus.LoadedMedia:
@@ -737,100 +805,74 @@ class WithYouWindow(QDialog):
             self._ambient_player.setPosition(0)
             self._ambient_player.play()
 
-    def _build_noise_popup(self) -> None:
-        self._noise_popup = QDialog(self)
-        self._noise_popup.setObjectName("noisePopup")
-        self._noise_popup.setWindowTitle("背景噪声")
-        self._noise_popup.setModal(False)
-        self._noise_popup.setWindowFlags(
+    def _build_popup(self, title: str, obj_name: str, close_tip: str) -> tuple[QDialog, QFrame, QVBoxLayout]:
+        """Frameless audio popup skeleton: dialog, rounded panel, and a title row with a close button."""
+        popup = QDialog(self)
+        popup.setObjectName(obj_name)
+        self._owned_subwindows.append(popup)
+        popup.setWindowTitle(title)
+        popup.setModal(False)
+        popup.setWindowFlags(
             Qt.WindowType.Tool | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint
         )
-        self._noise_popup.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        root = QVBoxLayout(self._noise_popup)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.setSpacing(0)
-        panel = QFrame(self._noise_popup)
-        panel.setObjectName("noisePopupPanel")
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(12, 10, 12, 10)
-        layout.setSpacing(8)
-        header_row = QHBoxLayout()
-        header_row.setContentsMargins(0, 0, 0, 0)
-        header_row.setSpacing(6)
-        header_row.addWidget(QLabel("背景噪声", panel))
-        header_row.addStretch(1)
+        popup.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        panel = QFrame(popup)
+        panel.setObjectName(f"{obj_name}Panel")
+        vbox(panel, parent=popup)
+        layout = vbox(spacing=8, margins=(12, 10, 12, 10), parent=panel)
         close_btn = QPushButton("关闭", panel)
         close_btn.setObjectName("ghostBtn")
-        close_btn.setToolTip("关闭噪声设置面板")
-        close_btn.clicked.connect(self._noise_popup.hide)
-        header_row.addWidget(close_btn)
-        layout.addLayout(header_row)
+        close_btn.setToolTip(close_tip)
+        close_btn.clicked.connect(popup.hide)
+        layout.addLayout(hbox(QLabel(title, panel), 1, close_btn, spacing=6))
+        # No per-popup setStyleSheet: the dialog is parented to this window and inherits its sheet,
+        # which already carries the #noisePopup / #bgmPopup rules.
+        return popup, panel, layout
+
+    def _build_noise_popup(self) -> None:
+        self._noise_popup, panel, layout = self._build_popup("背景噪声", "noisePopup", "关闭噪声设置面板")
         self._ambient_enabled_cb = QCheckBox("播放噪声（雪夜炉火）", panel)
+        self._ambient_enabled_cb.setChecked(self._ambient_enabled)
         self._ambient_enabled_cb.stateChanged.connect(self._on_ambient_enabled_changed)
         layout.addWidget(self._ambient_enabled_cb)
         vol_row = QHBoxLayout()
         vol_row.addWidget(QLabel("音量", panel))
         self._ambient_volume_slider = QSlider(Qt.Orientation.Horizontal, panel)
         self._ambient_volume_slider.setRange(0, 100)
-        self._ambient_volume_slider.setValue(50)
+        self._ambient_volume_slider.setValue(self._ambient_volume)
         self._ambient_volume_slider.valueChanged.connect(self._on_ambient_volume_changed)
         vol_row.addWidget(self._ambient_volume_slider, 1)
         layout.addLayout(vol_row)
-        root.addWidget(panel)
-        self._noise_popup.setStyleSheet(styles.build_focus_stylesheet(self._ui_scale()))
 
     def _build_bgm_popup(self) -> None:
-        self._bgm_popup = QDialog(self)
-        self._bgm_popup.setObjectName("bgmPopup")
-        self._bgm_popup.setWindowTitle("背景音乐")
-        self._bgm_popup.setModal(False)
-        self._bgm_popup.setWindowFlags(
-            Qt.WindowType.Tool | Qt.WindowType.WindowStaysOnTopHint | Qt.WindowType.FramelessWindowHint
-        )
-        self._bgm_popup.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-        root = QVBoxLayout(self._bgm_popup)
-        root.setContentsMargins(0, 0, 0, 0)
-        root.setSpacing(0)
-        panel = QFrame(self._bgm_popup)
-        panel.setObjectName("bgmPopupPanel")
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(12, 10, 12, 10)
-        layout.setSpacing(8)
-        header_row = QHBoxLayout()
-        header_row.setContentsMargins(0, 0, 0, 0)
-        header_row.setSpacing(6)
-        header_row.addWidget(QLabel("背景音乐", panel))
-        header_row.addStretch(1)
-        close_btn = QPushButton("关闭", panel)
-        close_btn.setObjectName("ghostBtn")
-        close_btn.setToolTip("关闭 BGM 设置面板")
-        close_btn.clicked.connect(self._bgm_popup.hide)
-        header_row.addWidget(close_btn)
-        layout.addLayout(header_row)
+        self._bgm_popup, panel, layout = self._build_popup("背景音乐", "bgmPopup", "关闭 BGM 设置面板")
         self._bgm_enabled_cb = QCheckBox("播放 BGM", panel)
+        self._bgm_enabled_cb.setChecked(self._bgm_enabled)
         self._bgm_enabled_cb.stateChanged.connect(self._on_bgm_enabled_changed)
         layout.addWidget(self._bgm_enabled_cb)
         vol_row = QHBoxLayout()
         vol_row.addWidget(QLabel("音量", panel))
         self._bgm_volume_slider = QSlider(Qt.Orientation.Horizontal, panel)
         self._bgm_volume_slider.setRange(0, 100)
-        self._bgm_volume_slider.setValue(60)
+        self._bgm_volume_slider.setValue(self._bgm_volume)
         self._bgm_volume_slider.valueChanged.connect(self._on_bgm_volume_changed)
         vol_row.addWidget(self._bgm_volume_slider, 1)
         layout.addLayout(vol_row)
         self._bgm_loop_cb = QCheckBox("单曲循环", panel)
+        self._bgm_loop_cb.setChecked(self._bgm_loop)
         self._bgm_loop_cb.stateChanged.connect(self._on_bgm_loop_changed)
         layout.addWidget(self._bgm_loop_cb)
         self._bgm_list = QListWidget(panel)
         self._bgm_list.setObjectName("chatTimeline")
         self._bgm_list.setMaximumHeight(px(100, self._ui_scale()))
+        self._fill_bgm_list()
         self._bgm_list.currentRowChanged.connect(self._on_bgm_list_selection_changed)
         layout.addWidget(self._bgm_list)
         self._bgm_seek_slider = QSlider(Qt.Orientation.Horizontal, panel)
         self._bgm_seek_slider.setRange(0, 0)
         self._bgm_seek_slider.sliderMoved.connect(self._on_bgm_seek_moved)
-        self._bgm_seek_slider.sliderPressed.connect(lambda: setattr(self, "_bgm_seek_block", True))
-        self._bgm_seek_slider.sliderReleased.connect(lambda: setattr(self, "_bgm_seek_block", False))
+        self._bgm_seek_slider.sliderPressed.connect(self._on_bgm_seek_pressed)
+        self._bgm_seek_slider.sliderReleased.connect(self._on_bgm_seek_released)
         layout.addWidget(self._bgm_seek_slider)
         self._bgm_time_label = QLabel("0:00 / 0:00", panel)
         layout.addWidget(self._bgm_time_label)
@@ -845,8 +887,9 @@ class WithYouWindow(QDialog):
         ctrl_row.addWidget(self._bgm_next_btn)
         ctrl_row.addStretch(1)
         layout.addLayout(ctrl_row)
-        root.addWidget(panel)
-        self._bgm_popup.setStyleSheet(styles.build_focus_stylesheet(self._ui_scale()))
+        if self._bgm_player is not None:
+            # Catch up with a track that started before the popup existed.
+            self._on_bgm_duration_changed(self._bgm_player.duration())
 
     def _reposition_noise_popup(self) -> None:
         btn_top_left = self._noise_btn.mapToGlobal(self._noise_btn.rect().topLeft())
@@ -863,12 +906,12 @@ class WithYouWindow(QDialog):
     @staticmethod
     def _apply_popup_rounded_mask(widget: QWidget, radius: int = 14) -> None:
         """圆角窗口遮罩，避免系统绘制直角阴影。"""
-        path = QPainterPath()
-        path.addRoundedRect(widget.rect(), radius, radius)
-        poly = path.toFillPolygon().toPolygon()
-        widget.setMask(QRegion(poly))  # type: ignore[call-arg]
+        size = widget.size()
+        widget.setMask(_rounded_mask_region(size.width(), size.height(), radius))
 
     def _open_noise_popup(self) -> None:
+        if self._noise_popup is None:
+            self._build_noise_popup()
         if self._noise_popup.isVisible():
             self._noise_popup.hide()
             return
@@ -878,6 +921,8 @@ class WithYouWindow(QDialog):
         self._noise_popup.show()
 
     def _open_bgm_popup(self) -> None:
+        if self._bgm_popup is None:
+            self._build_bgm_popup()
         if self._bgm_popup.isVisible():
             self._bgm_popup.hide()
             return
@@ -890,20 +935,49 @@ class WithYouWindow(QDialog):
         """点击开始专注后自动播放：根据勾选状态启动背景噪声与 BGM。"""
         if self._phase != "running":
             return
-        if self._ambient_enabled_cb.isChecked():
+        if self._ambient_enabled:
             self._start_ambient()
-        if self._bgm_enabled_cb.isChecked():
+        if self._bgm_enabled:
             self._start_bgm()
 
+    def _new_background_audio_output(self) -> QAudioOutput:
+        # Ambient and BGM share one default-device lookup per window.
+        if self._default_audio_out is None:
+            self._default_audio_out = QMediaDevices.defaultAudioOutput()
+        audio = QAudioOutput(self)
+        if not self._default_audio_out.isNull():
+            audio.setDevice(self._default_audio_out)
+        return audio
+
+    def _ensure_ambient_player(self) -> QMediaPlayer:
+        if self._ambient_player is None:
+            self._ambient_audio = self._new_background_audio_output()
+            self._ambient_player = QMediaPlayer(self)
+            self._ambient_player.setAudioOutput(self._ambient_audio)
+            self._ambient_player.mediaStatusChanged.connect(self._on_ambient_status_changed)
+        return self._ambient_player
+
+    def _ensure_bgm_player(self) -> QMediaPlayer:
+        if self._bgm_player is None:
+            self._bgm_audio = self._new_background_audio_output()
+            self._bgm_player = QMediaPlayer(self)
+            self._bgm_player.setAudioOutput(self._bgm_audio)
+            self._bgm_player.positionChanged.connect(self._on_bgm_position_changed)
+            self._bgm_player.durationChanged.connect(self._on_bgm_duration_changed)
+            self._bgm_player.mediaStatusChanged.connect(self._on_bgm_media_status_changed)
+        return self._bgm_player
+
     def _start_ambient(self) -> None:
-        if not self._ambient_enabled_cb.isChecked() or self._noise_path is None:
+        if not self._ambient_enabled or self._noise_url is None:
             return
-        self._ambient_audio.setVolume(self._ambient_volume_slider.value() / 100.0)
-        self._ambient_player.stop()
-        self._ambient_player.setSource(QUrl())
-        self._ambient_player.setSource(QUrl.fromLocalFile(str(self._noise_path.resolve())))
-        self._ambient_player.play()
-        QTimer.singleShot(400, self._ambient_player.play)
+        player = self._ensure_ambient_player()
+        self._ambient_audio.setVolume(self._ambient_volume / 100.0)
+        player.stop()
+        # No empty-URL detach first: that forces a second pipeline teardown/setup per start.
+        # Re-setting the same URL is a no-op, and play() after stop() restarts from 0.
+        player.setSource(self._noise_url)
+        # LoadedMedia in the status handler re-issues play() if the backend drops this early call.
+        player.play()
 
     def _on_bgm_media_status_changed(self, status) -> None:
         if status == QMediaPlayer.MediaStatus.LoadedMedia:
@@ -918,7 +992,7 @@ class WithYouWindow(QDialog):
             # stop/setSource switching, which can cause accidental next-track jumps.
             if self._bgm_switching_source:
                 return
-            if self._bgm_loop_cb.isChecked():
+            if self._bgm_loop:
                 self._bgm_resume_position_ms = 0
                 self._bgm_player.setPosition(0)
                 self._bgm_player.play()
@@ -926,7 +1000,7 @@ class WithYouWindow(QDialog):
                 next_idx = (self._bgm_index + 1) % len(self._bgm_playlist) if self._bgm_playlist else 0
                 if next_idx != self._bgm_index:
                     self._bgm_index = next_idx
-                    self._bgm_list.setCurrentRow(self._bgm_index)
+                    self._select_bgm_row(self._bgm_index)
                     self._bgm_play_index(self._bgm_index, start_position_ms=0)
                 else:
                     self._bgm_resume_position_ms = 0
@@ -938,101 +1012,147 @@ class WithYouWindow(QDialog):
         if index < 0 or index >= len(self._bgm_playlist):
             self._stop_bgm()
             return
-        if not self._bgm_enabled_cb.isChecked():
+        if not self._bgm_enabled:
             self._stop_bgm()
             return
-        path = self._bgm_playlist[index]
+        url = self._bgm_playlist[index][0]
+        player = self._ensure_bgm_player()
         self._apply_bgm_ducking_volume()
         self._bgm_pending_seek_ms = max(0, start_position_ms)
         self._bgm_resume_position_ms = self._bgm_pending_seek_ms
         self._bgm_switching_source = True
-        self._bgm_player.stop()
-        self._bgm_player.setSource(QUrl())
-        self._bgm_player.setSource(QUrl.fromLocalFile(path))
-        self._bgm_player.play()
-        QTimer.singleShot(400, self._bgm_player.play)
+        player.stop()
+        if player.source() == url:
+            # Same track is still loaded: LoadedMedia will not fire again, so seek and play here.
+            self._bgm_switching_source = False
+            if self._bgm_pending_seek_ms > 0:
+                player.setPosition(self._bgm_pending_seek_ms)
+                self._bgm_pending_seek_ms = 0
+            player.play()
+            self._refresh_video_priority_for_bgm()
+            return
+        player.setSource(url)
+        # LoadedMedia in the status handler re-issues play() if the backend drops this early call.
+        player.play()
 
     def _stop_ambient(self) -> None:
+        if self._ambient_player is None:
+            return
         self._ambient_player.stop()
-        self._ambient_player.setSource(QUrl())
+        if not self._ambient_player.source().isEmpty():
+            self._ambient_player.setSource(QUrl())
 
     def _on_bgm_volume_changed(self, value: int) -> None:
+        self._bgm_volume = value
         self._apply_bgm_ducking_volume()
-        self._with_you_settings.setValue("bgm/volume", value)
+        self._settings_writer.set("bgm/volume", value)
 
     def _on_bgm_enabled_changed(self, _state: int) -> None:
+        self._bgm_enabled = self._bgm_enabled_cb.isChecked()
         self._save_bgm_state()
-        if self._bgm_enabled_cb.isChecked():
+        if self._bgm_enabled:
             if self._phase in ("running", "config"):
                 self._start_bgm()
         else:
             self._stop_bgm()
 
     def _on_bgm_loop_changed(self, _state: int) -> None:
+        self._bgm_loop = self._bgm_loop_cb.isChecked()
         self._save_bgm_state()
 
     def _on_bgm_list_selection_changed(self, row: int) -> None:
         if row < 0 or row >= len(self._bgm_playlist):
             return
         self._bgm_index = row
-        self._with_you_settings.setValue("bgm/index", row)
+        self._settings_writer.set("bgm/index", row)
         self._bgm_resume_position_ms = 0
-        self._with_you_settings.setValue("bgm/position_ms", 0)
-        if self._phase in ("running", "config") and self._bgm_enabled_cb.isChecked():
+        self._settings_writer.set("bgm/position_ms", 0)
+        if self._phase in ("running", "config") and self._bgm_enabled:
             self._bgm_play_index(self._bgm_index, start_position_ms=0)
 
+    def _select_bgm_row(self, row: int) -> None:
+        if self._bgm_popup is not None:
+            self._bgm_list.setCurrentRow(row)
+
+    def _on_bgm_seek_pressed(self) -> None:
+        self._bgm_seek_block = True
+
+    def _on_bgm_seek_released(self) -> None:
+        self._bgm_seek_block = False
+
     def _on_bgm_seek_moved(self, position: int) -> None:
         self._bgm_resume_position_ms = max(0, position)
-        self._with_you_settings.setValue("bgm/position_ms", self._bgm_resume_position_ms)
-        self._bgm_player.setPosition(position)
+        self._settings_writer.set("bgm/position_ms", self._bgm_resume_position_ms)
+        if self._bgm_player is not None:
+            self._bgm_player.setPosition(position)
 
     def _bgm_prev_track(self) -> None:
         if not self._bgm_playlist:
             return
         self._bgm_index = (self._bgm_index - 1) % len(self._bgm_playlist)
-        self._bgm_list.setCurrentRow(self._bgm_index)
-        self._with_you_settings.setValue("bgm/index", self._bgm_index)
+        self._select_bgm_row(self._bgm_index)
+        self._settings_writer.set("bgm/index", self._bgm_index)
         self._bgm_resume_position_ms = 0
-        self._with_you_settings.setValue("bgm/position_ms", 0)
+        self._settings_writer.set("bgm/position_ms", 0)
         self._bgm_play_index(self._bgm_index, start_position_ms=0)
 
     def _bgm_next_track(self) -> None:
         if not self._bgm_playlist:
             return
         self._bgm_index = (self._bgm_index + 1) % len(self._bgm_playlist)
-        self._bgm_list.setCurrentRow(self._bgm_index)
-        self._with_you_settings.setValue("bgm/index", self._bgm_index)
+        self._select_bgm_row(self._bgm_index)
+        self._settings_writer.set("bgm/index", self._bgm_index)
         self._bgm_resume_position_ms = 0
-        self._with_you_settings.setValue("bgm/position_ms", 0)
+        self._settings_writer.set("bgm/position_ms", 0)
         self._bgm_play_index(self._bgm_index, start_position_ms=0)
 
     def _on_bgm_position_changed(self, position: int) -> None:
-        if getattr(self, "_bgm_seek_block", False):
+        if self._bgm_seek_block:
             return
         self._bgm_resume_position_ms = max(0, position)
-        self._with_you_settings.setValue("bgm/position_ms", self._bgm_resume_position_ms)
-        self._bgm_seek_slider.setMaximum(max(self._bgm_player.duration(), 1))
+        # Qt 6 has no notify interval; ~4 Hz is plenty for the slider and m:ss label. Seeks jump further.
+        if abs(position - self._last_bgm_label_ms) < 250:
+            return
+        self._last_bgm_label_ms = position
+        self._settings_writer.set("bgm/position_ms", self._bgm_resume_position_ms)
+        if self._bgm_popup is None:
+            return
         self._bgm_seek_slider.setValue(position)
-        d = self._bgm_player.duration()
-        self._bgm_time_label.setText(f"{position // 1000 // 60}:{position // 1000 % 60:02d} / {d // 1000 // 60}:{d // 1000 % 60:02d}" if d > 0 else "0:00 / 0:00")
+        if not self._bgm_duration_str:
+            self._bgm_time_label.setText("0:00 / 0:00")
+            return
+        minutes, seconds = divmod(position // 1000, 60)
+        self._bgm_time_label.setText(f"{minutes}:{seconds:02d} / {self._bgm_duration_str}")
 
     def _on_bgm_duration_changed(self, duration: int) -> None:
-        self._bgm_seek_slider.setRange(0, max(0, duration))
+        if duration > 0:
+            minutes, seconds = divmod(duration // 1000, 60)
+            self._bgm_duration_str = f"{minutes}:{seconds:02d}"
+        else:
+            self._bgm_duration_str = ""
+        self._last_bgm_label_ms = -1000
+        if self._bgm_popup is not None:
+            self._bgm_seek_slider.setRange(0, max(0, duration))
 
     def _start_bgm(self) -> None:
-        if not self._bgm_enabled_cb.isChecked() or not self._bgm_playlist:
+        if not self._bgm_enabled or not self._bgm_playlist:
             return
         self._bgm_index = min(self._bgm_index, len(self._bgm_playlist) - 1)
         self._bgm_play_index(self._bgm_index, start_position_ms=self._bgm_resume_position_ms)
 
     def _stop_bgm(self) -> None:
-        self._bgm_resume_position_ms = max(0, self._bgm_player.position())
-        self._with_you_settings.setValue("bgm/position_ms", self._bgm_resume_position_ms)
+        if self._bgm_player is not None:
+            self._bgm_resume_position_ms = max(0, self._bgm_player.position())
+            self._bgm_player.stop()
+            if not self._bgm_player.source().isEmpty():
+                self._bgm_player.setSource(QUrl())
+        self._settings_writer.set("bgm/position_ms", self._bgm_resume_position_ms)
         self._bgm_switching_source = False
-        self._bgm_player.stop()
-        self._bgm_player.setSource(QUrl())
-        self._bgm_seek_slider.setRange(0, 0)
-        self._bgm_time_label.setText("0:00 / 0:00")
+        self._bgm_duration_str = ""
+        self._last_bgm_label_ms = -1000
+        if self._bgm_popup is not None:
+            self._bgm_seek_slider.setRange(0, 0)
+            self._bgm_time_label.setText("0:00 / 0:00")
         self._refresh_video_priority_for_bgm()
 
     def _on_video_playback_state_changed(self, _state) -> None:
@@ -1045,9 +1165,9 @@ class WithYouWindow(QDialog):
         )
 
     def _apply_bgm_ducking_volume(self) -> None:
-        if not hasattr(self, "_bgm_volume_slider"):
+        if self._bgm_audio is None:
             return
-        base = max(0.0, min(1.0, self._bgm_volume_slider.value() / 100.0))
+        base = max(0.0, min(1.0, self._bgm_volume / 100.0))
         target = base
         # Only duck when playing a one-shot voice clip (start/break/end), not the looped withyou video or when in config
         if self._phase == "running" and self._is_video_audio_active() and not self._loop_video:
@@ -1055,28 +1175,25 @@ class WithYouWindow(QDialog):
         self._bgm_audio.setVolume(max(0.0, min(1.0, target)))
 
     def _refresh_video_priority_for_bgm(self) -> None:
-        if not hasattr(self, "_bgm_enabled_cb"):
-            self._player.setAudioOutput(self._audio)
-            self._audio.setVolume(1.0)
-            self._frame_interval_s = self._fallback_frame_interval_normal_s
-            return
         self._player.setAudioOutput(self._audio)
         self._audio.setVolume(1.0)
         bgm_playing = (
-            self._bgm_enabled_cb.isChecked()
+            self._bgm_enabled
+            and self._bgm_player is not None
             and self._bgm_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         )
         self._apply_bgm_ducking_volume()
         if bgm_playing:
-            self._frame_interval_s = self._fallback_frame_interval_bgm_priority_s
+            self._frame_interval_ms = self._fallback_frame_interval_bgm_priority_ms
             return
-        self._frame_interval_s = self._fallback_frame_interval_normal_s
+        self._frame_interval_ms = self._fallback_frame_interval_normal_ms
 
     def _set_view_mode(self, mode: str) -> None:
         self.setProperty("viewMode", mode)
         style = self.style()
         if style is not None:
-            style.unpolish(self)
+            # polish() alone re-resolves the stylesheet rules for the new property value;
+            # unpolish() is only needed when swapping styles.
             style.polish(self)
         if mode == "focus":
             self.setWindowOpacity(1.0)
@@ -1106,25 +1223,32 @@ class WithYouWindow(QDialog):
         self._set_cinematic_mode()
         self._play_media(self._answer_path, loop=False)
 
-    def _pick_media(self, names: tuple[str, ...]) -> Path | None:
-        for name in names:
-            p = self._call_dir / name
-            if p.exists():
-                return p
+    def _index_call_dir(self) -> dict[str, Path]:
+        """One directory read of resources/Call, keyed by lower-cased file name."""
+        try:
+            with os.scandir(self._call_dir) as entries:
+                return {entry.name.lower(): Path(entry.path) for entry in entries if entry.is_file()}
+        except OSError:
+            return {}
+
+    def _pick_media(self, *stems: str, exts: tuple[str, ...] = _VIDEO_EXTS) -> Path | None:
+        """First existing `<stem><ext>` in resources/Call, matched case-insensitively."""
+        for stem in stems:
+            for ext in exts:
+                p = self._media_index.get(f"{stem}{ext}".lower())
+                if p is not None:
+                    return p
         return None
 
-    @staticmethod
-    def _audio_extensions() -> tuple[str, ...]:
-        return (".mp3", ".m4a", ".wav", ".flac", ".ogg", ".MP3", ".M4A", ".WAV", ".FLAC", ".OGG")
-
     def _scan_audio_dir(self, directory: Path) -> list[Path]:
-        if not directory.is_dir():
+        try:
+            st = directory.stat()
+        except OSError:
             return []
-        exts = self._audio_extensions()
-        return sorted(
-            (p for p in directory.resolve().iterdir() if p.is_file() and p.suffix in exts),
-            key=lambda p: p.name.lower(),
-        )
+        if not S_ISDIR(st.st_mode):
+            return []
+        # Adding/removing files bumps the directory mtime, which invalidates the cached listing.
+        return list(_scan_audio_dir_cached(str(directory), st.st_mtime_ns))
 
     def _first_audio_in_dir(self, directory: Path) -> Path | None:
         files = self._scan_audio_dir(directory)
@@ -1132,24 +1256,29 @@ class WithYouWindow(QDialog):
 
     def _refresh_bgm_playlist(self) -> None:
         """从 resources/Call/bgm 扫描音频，只显示歌名。"""
-        self._bgm_playlist = [str(p.resolve()) for p in self._scan_audio_dir(self._bgm_dir)]
-        if not hasattr(self, "_bgm_list") or self._bgm_list is None:
-            return
-        self._bgm_list.clear()
-        for path in self._bgm_playlist:
-            self._bgm_list.addItem(QListWidgetItem(Path(path).name))
+        self._bgm_playlist = [
+            (QUrl.fromLocalFile(str(p)), p.name) for p in self._scan_audio_dir(self._bgm_dir)
+        ]
         self._bgm_index = max(0, min(self._bgm_index, len(self._bgm_playlist) - 1))
+        if self._bgm_popup is not None:
+            self._fill_bgm_list()
+
+    def _fill_bgm_list(self) -> None:
+        self._bgm_list.clear()
+        for _url, name in self._bgm_playlist:
+            self._bgm_list.addItem(QListWidgetItem(name))
         if self._bgm_playlist:
             self._bgm_list.blockSignals(True)
             self._bgm_list.setCurrentRow(self._bgm_index)
             self._bgm_list.blockSignals(False)
 
-    def _pick_media_candidates(self, names: tuple[str, ...]) -> list[Path]:
+    def _pick_media_candidates(self, *stems: str, exts: tuple[str, ...] = _VIDEO_EXTS) -> list[Path]:
         candidates: list[Path] = []
-        for name in names:
-            p = self._call_dir / name
-            if p.exists():
-                candidates.append(p)
+        for stem in stems:
+            for ext in exts:
+                p = self._media_index.get(f"{stem}{ext}".lower())
+                if p is not None and p not in candidates:
+                    candidates.append(p)
         return candidates
 
     def _apply_soft_shadow(self, widget: QWidget, blur_radius: int, y_offset: int, *, alpha: int = 36) -> None:
@@ -1159,10 +1288,17 @@ class WithYouWindow(QDialog):
         effect.setColor(QColor(23, 36, 51, max(0, min(255, alpha))))
         widget.setGraphicsEffect(effect)
 
+    def _media_url(self, media_path: Path) -> QUrl:
+        """File URL for a clip (paths come from the resolved call dir), computed once per path."""
+        url = self._media_urls.get(media_path)
+        if url is None:
+            url = QUrl.fromLocalFile(str(media_path))
+            self._media_urls[media_path] = url
+        return url
+
     def _play_media(self, media_path: Path, *, loop: bool) -> None:
-        resolved = str(media_path.resolve())
         if (
-            self._current_media_source == resolved
+            self._current_media_path == media_path
             and self._loop_video == loop
             and self._player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         ):
@@ -1176,10 +1312,12 @@ class WithYouWindow(QDialog):
             loops = QMediaPlayer.Loops.Infinite if loop else 1
             self._player.setLoops(loops)
         self._player.stop()
-        # Force-detach previous stream before switching to new media.
-        self._player.setSource(QUrl())
-        self._current_media_source = resolved
-        self._player.setSource(QUrl.fromLocalFile(resolved))
+        options = self._loop_playback_options if loop else self._oneshot_playback_options
+        if options is not None:
+            self._player.setPlaybackOptions(options)
+        # stop() is enough before switching; the empty-URL detach is kept for the full teardown paths only.
+        self._current_media_path = media_path
+        self._player.setSource(self._media_url(media_path))
         self._player.play()
 
     def _stop_all_playback(self) -> None:
@@ -1188,8 +1326,8 @@ class WithYouWindow(QDialog):
             self._player.setLoops(1)
         self._player.stop()
         self._player.setSource(QUrl())
-        self._current_media_source = ""
-        self._sfx_player.stop()
+        self._current_media_path = None
+        self._stop_start_sfx()
         self._restore_background_audio_after_voice(resume=False)
         self._stop_ambient()
         self._stop_bgm()
@@ -1201,8 +1339,8 @@ class WithYouWindow(QDialog):
             self._player.setLoops(1)
         self._player.stop()
         self._player.setSource(QUrl())
-        self._current_media_source = ""
-        self._sfx_player.stop()
+        self._current_media_path = None
+        self._stop_start_sfx()
         self._restore_background_audio_after_voice(resume=True)
 
     def _pause_background_audio_for_voice(self) -> None:
@@ -1210,11 +1348,13 @@ class WithYouWindow(QDialog):
             return
         self._background_audio_paused_for_voice = True
         self._resume_ambient_after_voice = (
-            self._ambient_enabled_cb.isChecked()
+            self._ambient_enabled
+            and self._ambient_player is not None
             and self._ambient_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         )
         self._resume_bgm_after_voice = (
-            self._bgm_enabled_cb.isChecked()
+            self._bgm_enabled
+            and self._bgm_player is not None
             and self._bgm_player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
         )
         if self._resume_ambient_after_voice:
@@ -1226,8 +1366,8 @@ class WithYouWindow(QDialog):
     def _restore_background_audio_after_voice(self, *, resume: bool) -> None:
         if not self._background_audio_paused_for_voice:
             return
-        should_resume_ambient = resume and self._resume_ambient_after_voice and self._ambient_enabled_cb.isChecked()
-        should_resume_bgm = resume and self._resume_bgm_after_voice and self._bgm_enabled_cb.isChecked()
+        should_resume_ambient = resume and self._resume_ambient_after_voice and self._ambient_enabled
+        should_resume_bgm = resume and self._resume_bgm_after_voice and self._bgm_enabled
         self._background_audio_paused_for_voice = False
         self._resume_ambient_after_voice = False
         self._resume_bgm_after_voice = False
@@ -1237,11 +1377,21 @@ class WithYouWindow(QDialog):
             self._bgm_player.play()
         self._refresh_video_priority_for_bgm()
 
+    def _stop_start_sfx(self) -> None:
+        if self._sfx_effect is not None:
+            self._sfx_effect.stop()
+        elif self._sfx_player is not None:
+            self._sfx_player.stop()
+
     def _play_start_sfx(self) -> None:
-        if self._start_sfx_path is None:
+        if self._sfx_effect is not None:
+            self._sfx_effect.stop()
+            self._sfx_effect.play()
+            return
+        if self._sfx_player is None:
             return
         self._sfx_player.stop()
-        self._sfx_player.setSource(QUrl.fromLocalFile(str(self._start_sfx_path)))
+        self._sfx_player.setPosition(0)
         self._sfx_player.play()
 
     def _play_focus_entry_media(self) -> None:
@@ -1298,6 +1448,7 @@ class WithYouWindow(QDialog):
             return
         self._active_video_label = cast(QLabel, self._cinematic_video)
         self._active_video_label.setPixmap(QPixmap())
+        self._last_render_key = None
 
     def _activate_withyou_video_output(self) -> None:
         self._cinematic_fill_mode = False
@@ -1319,6 +1470,26 @@ class WithYouWindow(QDialog):
         else:
             self._ribbon_overlay.lower()
 
+    def _prewarm_phase_media(self) -> None:
+        """
+        Read the phase clips into the OS file cache off the GUI thread, so the first open at a phase
+        boundary does not wait on disk. Demuxer/decoder state is per QMediaPlayer and cannot be warmed
+        from outside self._player, so no extra player pipelines are opened here.
+        """
+        if self._media_prewarmed:
+            return
+        self._media_prewarmed = True
+        clips = (
+            self._start1_path,
+            self._start2_path,
+            *self._break_paths,
+            *self._end_paths,
+            self._withyou_path,
+            self._hangup_path,
+        )
+        paths = list(dict.fromkeys(p for p in clips if p is not None))
+        threading.Thread(target=_read_ahead_files, args=(paths,), daemon=True).start()
+
     def _enter_config(self, *, preserve_progress: bool = False) -> None:
         self._phase = "config"
         self._set_view_mode("config")
@@ -1342,8 +1513,8 @@ class WithYouWindow(QDialog):
             self._is_break_phase = False
             self._is_paused = False
             self.status_label.setText("番茄钟设置")
-            self.round_label.setText("第 0/0 轮")
-            self.countdown_label.setText("00:00")
+            self._set_round_text("第 0/0 轮", "")
+            self._set_countdown_text("00:00")
             self.return_btn.setVisible(False)
         self.start_btn.setEnabled(True)
         self.rounds_spin.setEnabled(True)
@@ -1359,21 +1530,22 @@ class WithYouWindow(QDialog):
         self.pause_btn.setVisible(False)
         self.skip_btn.setEnabled(False)
         self.skip_btn.setVisible(False)
-        self._set_pause_button_state()
-        self._update_mini_bar_state()
+        self._refresh_chrome()
+        # Config is idle time for the user; pull the clips played at phase boundaries into the file cache.
+        QTimer.singleShot(0, self._prewarm_phase_media)
 
     def _back_to_settings(self) -> None:
         if self._phase != "running":
             return
-        self._resume_state = {
-            "total_rounds": self._total_rounds,
-            "current_round": self._current_round,
-            "round_seconds": self._round_seconds,
-            "break_seconds": self._break_seconds,
-            "remaining_seconds": self._remaining_seconds,
-            "is_break_phase": self._is_break_phase,
-            "was_paused": self._is_paused,
-        }
+        self._resume_state = _ResumeState(
+            total_rounds=self._total_rounds,
+            current_round=self._current_round,
+            round_seconds=self._round_seconds,
+            break_seconds=self._break_seconds,
+            remaining_seconds=self._remaining_seconds,
+            is_break_phase=self._is_break_phase,
+            was_paused=self._is_paused,
+        )
         self._tick.stop()
         self._player.stop()
         self._enter_config(preserve_progress=True)
@@ -1386,10 +1558,10 @@ class WithYouWindow(QDialog):
         self._middle_stack.setCurrentWidget(self._withyou_panel)
         self._sync_ribbon_overlay_stack()
         self._activate_withyou_video_output()
-        self._total_rounds = max(1, int(self.rounds_spin.value()))
+        self._total_rounds = max(1, self.rounds_spin.value())
         self._current_round = 1
-        focus_total_seconds = int(self.focus_min_spin.value()) * 60 + int(self.focus_sec_spin.value())
-        break_total_seconds = int(self.break_min_spin.value()) * 60 + int(self.break_sec_spin.value())
+        focus_total_seconds = self.focus_min_spin.value() * 60 + self.focus_sec_spin.value()
+        break_total_seconds = self.break_min_spin.value() * 60 + self.break_sec_spin.value()
         self._round_seconds = max(1, focus_total_seconds)
         self._break_seconds = max(1, break_total_seconds)
         self._remaining_seconds = self._round_seconds
@@ -1412,12 +1584,11 @@ class WithYouWindow(QDialog):
         self.pause_btn.setVisible(True)
         self.skip_btn.setEnabled(True)
         self.skip_btn.setVisible(True)
-        self._set_pause_button_state()
         self.status_label.setText("专注中")
         self._sync_round_ui()
         self._sync_countdown_ui()
         self._tick.start()
-        self._update_mini_bar_state()
+        self._refresh_chrome()
         self._play_focus_entry_media()
         # 点击开始专注后自动播放：界面切换完成后再启动背景噪声与 BGM，避免设备未就绪
         QTimer.singleShot(150, self._start_focus_audio)
@@ -1426,15 +1597,16 @@ class WithYouWindow(QDialog):
             QMessageBox.information(self, "缺少素材", "未找到 withyou 视频素材，将仅保留计时。")
 
     def _return_to_running_without_changes(self) -> None:
-        if not self._resume_state:
-            return
-        self._total_rounds = int(self._resume_state.get("total_rounds", self._total_rounds))
-        self._current_round = int(self._resume_state.get("current_round", self._current_round))
-        self._round_seconds = int(self._resume_state.get("round_seconds", self._round_seconds))
-        self._break_seconds = int(self._resume_state.get("break_seconds", self._break_seconds))
-        self._remaining_seconds = int(self._resume_state.get("remaining_seconds", self._remaining_seconds))
-        self._is_break_phase = bool(self._resume_state.get("is_break_phase", False))
-        self._is_paused = bool(self._resume_state.get("was_paused", False))
+        state = self._resume_state
+        if state is None:
+            return
+        self._total_rounds = state.total_rounds
+        self._current_round = state.current_round
+        self._round_seconds = state.round_seconds
+        self._break_seconds = state.break_seconds
+        self._remaining_seconds = state.remaining_seconds
+        self._is_break_phase = state.is_break_phase
+        self._is_paused = state.was_paused
         self._resume_state = None
 
         self._phase = "running"
@@ -1472,10 +1644,8 @@ class WithYouWindow(QDialog):
             self._break_intro_playing = False
             if self._withyou_path is not None:
                 self._play_media(self._withyou_path, loop=True)
-        self._sync_round_ui()
-        self._sync_countdown_ui()
         self._set_pause_button_state()
-        self._update_mini_bar_state()
+        self._refresh_ui()
 
     def _start_hangup(self) -> None:
         self._tick.stop()
@@ -1490,27 +1660,54 @@ class WithYouWindow(QDialog):
         self._set_cinematic_mode()
         self._play_media(self._hangup_path, loop=False)
 
+    def _set_round_text(self, text: str, stage: str) -> None:
+        if self._last_ui["round"] != text:
+            self._last_ui["round"] = text
+            self.round_label_num.setText(text)
+        if self._last_ui["round_stage"] != stage:
+            self._last_ui["round_stage"] = stage
+            self.round_label_stage.setText(stage)
+            self.round_label_stage.setVisible(bool(stage))
+
+    def _set_countdown_text(self, text: str) -> None:
+        if self._last_ui["countdown"] == text:
+            return
+        self._last_ui["countdown"] = text
+        self.countdown_label.setText(text)
+        if self._mini_bar is not None:
+            self._mini_bar.set_countdown(text)
+
     def _sync_round_ui(self) -> None:
-        stage = "休息" if self._is_break_phase else "专注"
-        self.round_label.setText(
-            f'第 {self._current_round}/{self._total_rounds} 轮 · '
-            f'<span style="font-size:32px;">{stage}</span>'
+        self._set_round_text(
+            f"第 {self._current_round}/{self._total_rounds} 轮 ·",
+            "休息" if self._is_break_phase else "专注",
         )
 
     def _sync_countdown_ui(self) -> None:
         sec = max(0, int(self._remaining_seconds))
-        text = f"{sec // 60:02d}:{sec % 60:02d}"
-        self.countdown_label.setText(text)
-        if self._mini_bar is not None:
-            self._mini_bar.set_countdown(text)
-        self._update_status_tray_state()
+        self._set_countdown_text(f"{sec // 60:02d}:{sec % 60:02d}")
+
+    def _refresh_ui(self) -> None:
+        """Push round, countdown and stage to the window, mini bar and tray in one pass."""
+        self._sync_round_ui()
+        self._sync_countdown_ui()
+        stage, countdown = self._current_stage_and_countdown()
+        if stage != self._last_ui["stage"]:
+            self._apply_stage(stage, countdown)
+        else:
+            self._update_status_tray_state(stage, countdown)
 
     def _sync_middle_height(self) -> None:
         if self._withyou_width <= 0 or self._withyou_height <= 0:
             return
-        target_h = int(round(self.width() * (self._withyou_height / self._withyou_width)))
         top_h = max(64, self._top_bar.sizeHint().height())
         bottom_h = max(64, self._bottom_bar.sizeHint().height())
+        # The window size is fixed, so the bars' hints (which grow once the stylesheet lands) must be in the key.
+        key = (self.width(), self.height(), top_h, bottom_h)
+        if key == self._last_sync_key:
+            return
+        self._last_sync_key = key
+        target_h = int(round(self.width() * (self._withyou_height / self._withyou_width)))
         available = self.height() - top_h - bottom_h
         max_h = max(120, available)
         self._middle_stack.setFixedHeight(min(target_h, max_h))
@@ -1521,31 +1718,25 @@ class WithYouWindow(QDialog):
         if self._is_paused:
             return
         self._remaining_seconds -= 1
-        stage_changed = False
         if self._remaining_seconds <= 0:
             if self._is_break_phase:
                 if self._current_round >= self._total_rounds:
                     self._finish_all_rounds()
                     return
                 self._is_break_phase = False
-                stage_changed = True
                 self._current_round += 1
                 self._remaining_seconds = self._round_seconds
                 self.status_label.setText("专注中")
                 self._play_focus_entry_media()
             else:
                 self._is_break_phase = True
-                stage_changed = True
                 self._remaining_seconds = self._break_seconds
                 self.status_label.setText("休息中")
                 if self._break_paths:
                     self._break_intro_playing = True
                     self._set_cinematic_mode(fill=True)
                     self._play_media(random.choice(self._break_paths), loop=False)
-            self._sync_round_ui()
-        if stage_changed:
-            self._update_mini_bar_state()
-        self._sync_countdown_ui()
+        self._refresh_ui()
 
     def _toggle_pause(self) -> None:
         if self._phase != "running":
@@ -1556,7 +1747,7 @@ class WithYouWindow(QDialog):
         else:
             self.status_label.setText("休息中" if self._is_break_phase else "专注中")
         self._set_pause_button_state()
-        self._update_mini_bar_state()
+        self._refresh_ui()
 
     def _skip_current_stage(self) -> None:
         if self._phase != "running":
@@ -1580,27 +1771,39 @@ class WithYouWindow(QDialog):
                 self._break_intro_playing = True
                 self._set_cinematic_mode(fill=True)
                 self._play_media(random.choice(self._break_paths), loop=False)
-        self._sync_round_ui()
-        self._sync_countdown_ui()
         self._set_pause_button_state()
-        self._update_mini_bar_state()
+        self._refresh_ui()
 
     def _on_video_frame_changed(self, frame) -> None:
         if HAS_QVIDEO_WIDGET:
             return
-        now = time.monotonic()
-        if (now - self._last_frame_render_ts) < self._frame_interval_s:
-            return
-        self._last_frame_render_ts = now
         if frame is None or not frame.isValid():
             return
+        # Single-slot mailbox: newer frames overwrite the pending one, and one drain is queued at a time.
+        # Frames are never rendered faster than _frame_interval_ms, but the freshest frame always shows.
+        self._pending_frame = frame
+        if self._frame_drain_scheduled:
+            return
+        self._frame_drain_scheduled = True
+        delay = max(0, self._next_frame_ms - self._frame_clock.elapsed())
+        QTimer.singleShot(delay, self._drain_pending_frame)
+
+    def _drain_pending_frame(self) -> None:
+        self._frame_drain_scheduled = False
+        frame = self._pending_frame
+        self._pending_frame = None
+        if frame is None:
+            return
+        # Nothing shows the frame while the label is off-page or the window is hidden (mini mode).
+        label = self._active_video_label
+        if label is None or not label.isVisible():
+            return
+        self._next_frame_ms = self._frame_clock.elapsed() + self._frame_interval_ms
         image = frame.toImage()
         if image.isNull():
             return
-        pix = QPixmap.fromImage(image)
-        if pix.isNull():
-            return
-        self._last_frame = pix
+        # Keep the decoded QImage; _render_frame scales it natively before any pixmap upload.
+        self._last_frame = image
         self._render_frame()
 
     def _render_frame(self) -> None:
@@ -1613,12 +1816,33 @@ class WithYouWindow(QDialog):
             mode = Qt.AspectRatioMode.KeepAspectRatioByExpanding
         if self._active_video_label is self._cinematic_video and self._cinematic_fill_mode:
             mode = Qt.AspectRatioMode.KeepAspectRatioByExpanding
-        scaled = self._last_frame.scaled(
-            self._active_video_label.size(),
-            mode,
-            Qt.TransformationMode.FastTransformation,
+        dpr = self._active_video_label.devicePixelRatioF()
+        target = self._active_video_label.size() * dpr
+        if target.isEmpty():
+            return
+        # Resize bursts re-run this for the same frame; skip when nothing would change.
+        render_key = (self._active_video_label, target, mode, self._last_frame.cacheKey())
+        if render_key == self._last_render_key:
+            return
+        self._last_render_key = render_key
+        # Fresh label-sized image per frame: fromImage() below shares its data with the pixmap, so a
+        # reused buffer would only be detached (copied) by the next QPainter.
+        buffer = QImage(target, QImage.Format.Format_RGB32)
+        fitted = self._last_frame.size().scaled(target, mode)
+        dest = QRect(
+            (target.width() - fitted.width()) // 2,
+            (target.height() - fitted.height()) // 2,
+            fitted.width(),
+            fitted.height(),
         )
-        self._active_video_label.setPixmap(scaled)
+        painter = QPainter(buffer)
+        if mode == Qt.AspectRatioMode.KeepAspectRatio:
+            painter.fillRect(buffer.rect(), Qt.GlobalColor.black)
+        painter.drawImage(dest, self._last_frame)
+        painter.end()
+        pix = QPixmap.fromImage(buffer, Qt.ImageConversionFlag.NoFormatConversion)
+        pix.setDevicePixelRatio(dpr)
+        self._active_video_label.setPixmap(pix)
 
     def _on_media_status_changed(self, status) -> None:
         if status != QMediaPlayer.MediaStatus.EndOfMedia:
@@ -1678,6 +1902,7 @@ class WithYouWindow(QDialog):
     def _open_note_window(self) -> None:
         if self._note_window is None:
             self._note_window = StickyNoteWindow(self)
+            self._owned_subwindows.append(self._note_window)
         self._note_window.show()
         self._note_window.raise_()
         self._note_window.activateWindow()
@@ -1721,11 +1946,13 @@ class WithYouWindow(QDialog):
     def _ensure_mini_bar(self) -> MiniCallBar:
         if self._mini_bar is None:
             self._mini_bar = MiniCallBar(parent=None, theme_tokens=styles.focus_theme_tokens())
+            self._owned_subwindows.append(self._mini_bar)
             self._mini_bar.expandRequested.connect(self._exit_mini_mode)
             self._mini_bar.chatRequested.connect(self._request_chat_window)
             self._mini_bar.pauseRequested.connect(self._toggle_pause)
             self._mini_bar.hangupRequested.connect(self._start_hangup)
             self._apply_mini_bar_icons()
+            self._mini_bar.set_countdown(self._last_ui["countdown"] or "00:00")
         return self._mini_bar
 
     def _enter_mini_mode(self) -> None:
@@ -1760,9 +1987,9 @@ class WithYouWindow(QDialog):
             return None
         else:
             tray = QSystemTrayIcon(self)
-            tray.setToolTip("专注计时器（点击展开）")
+            self._set_tray_tooltip(tray, "专注计时器（点击展开）")
 
-            icon = self._load_icon(("icon.webp", "icon.png", "icon.PNG"))
+            icon = self._load_icon(TRAY_ICONS)
             if icon is None or icon.isNull():
                 root_icon = self._resources_dir / "icon.webp"
                 if root_icon.exists():
@@ -1770,13 +1997,22 @@ class WithYouWindow(QDialog):
             if icon is not None and not icon.isNull():
                 tray.setIcon(icon)
 
+        menu = self._ensure_status_tray_menu()
+        if self._shared_tray is None:
+            self._set_tray_context_menu(tray, menu)
+            tray.activated.connect(self._on_status_tray_activated)
+
+        self._status_tray = tray
+        self._update_status_tray_state()
+        return tray
+
+    def _ensure_status_tray_menu(self) -> QMenu:
+        """Build the tray menu once; later refreshes only touch the stage action text."""
+        if self._status_tray_menu is not None:
+            return self._status_tray_menu
         menu = QMenu()
-        menu_font = menu.font()
-        if menu_font.pointSize() > 0:
-            menu_font.setPointSize(menu_font.pointSize() + 2)
-        elif menu_font.pixelSize() > 0:
-            menu_font.setPixelSize(menu_font.pixelSize() + 2)
-        menu.setFont(menu_font)
+        # Derived per menu (the menu is built once per window) so it follows app.setFont() on DPI changes.
+        menu.setFont(_enlarged_menu_font(menu.font()))
         stage_action = QAction("当前环节：设置中 · 00:00", menu)
         stage_action.setEnabled(False)
         expand_action = QAction("展开计时器", menu)
@@ -1791,15 +2027,10 @@ class WithYouWindow(QDialog):
         menu.addAction(chat_action)
         menu.addSeparator()
         menu.addAction(hangup_action)
-        if self._shared_tray is None:
-            tray.setContextMenu(menu)
-            tray.activated.connect(self._on_status_tray_activated)
-
-        self._status_tray = tray
         self._status_tray_menu = menu
         self._status_tray_stage_action = stage_action
-        self._update_status_tray_state()
-        return tray
+        self._last_tray_state = None
+        return menu
 
     def _set_status_tray_visible(self, visible: bool) -> None:
         tray = self._ensure_status_tray()
@@ -1809,65 +2040,70 @@ class WithYouWindow(QDialog):
             self._status_tray_active = True
             self._update_status_tray_state()
             if self._status_tray_menu is not None:
-                tray.setContextMenu(self._status_tray_menu)
-            tray.setToolTip(f"专注计时器：{self._current_stage_and_countdown()[0]} · {self._current_stage_and_countdown()[1]}")
+                self._set_tray_context_menu(tray, self._status_tray_menu)
             if self._shared_tray is None:
                 tray.show()
         else:
             self._status_tray_active = False
+            # The shared tray's tooltip reverts to the default below; forget the cached state so the
+            # next show re-applies the stage tooltip even if stage/countdown are unchanged.
+            self._last_tray_state = None
             if self._shared_tray is not None:
                 if self._shared_tray_default_menu is not None:
-                    tray.setContextMenu(self._shared_tray_default_menu)
-                tray.setToolTip(self._shared_tray_default_tooltip)
+                    self._set_tray_context_menu(tray, self._shared_tray_default_menu)
+                self._set_tray_tooltip(tray, self._shared_tray_default_tooltip)
             else:
                 tray.hide()
 
+    # The tray may be shared with the main window, which also writes it: compare against the tray
+    # itself rather than a per-window copy of the last value.
+    @staticmethod
+    def _set_tray_context_menu(tray: QSystemTrayIcon, menu: QMenu) -> None:
+        if tray.contextMenu() is not menu:
+            tray.setContextMenu(menu)
+
+    @staticmethod
+    def _set_tray_tooltip(tray: QSystemTrayIcon, text: str) -> None:
+        if tray.toolTip() != text:
+            tray.setToolTip(text)
+
     def _on_status_tray_activated(self, reason) -> None:
         # Keep tray icon passive: no auto-expand on click.
         _ = reason
 
     def _current_stage_and_countdown(self) -> tuple[str, str]:
-        stage = "通话中"
         if self._phase == "running":
-            if self._is_paused:
-                stage = "已暂停"
-            elif self._is_break_phase:
-                stage = "休息中"
-            else:
-                stage = "专注中"
-        elif self._phase == "config":
-            stage = "设置中"
-        elif self._phase == "hangup":
-            stage = "结束中"
-        countdown = self.countdown_label.text() if hasattr(self, "countdown_label") else "00:00"
+            stage = self._RUNNING_STAGE[(self._is_paused, self._is_break_phase)]
+        else:
+            stage = self._PHASE_STAGE.get(self._phase, "通话中")
+        countdown = self.countdown_label.text() if self.countdown_label is not None else "00:00"
         return stage, countdown
 
     def call_stage_line(self) -> str | None:
         if not self._call_active:
             return None
-        stage, countdown = self._current_stage_and_countdown()
-        return f"{stage} · {countdown}"
-
-    def _update_status_tray_state(self) -> None:
-        stage, countdown = self._current_stage_and_countdown()
-        line = f"{stage} · {countdown}"
+        return self._STAGE_LINE_FMT.format(*self._current_stage_and_countdown())
+
+    def _update_status_tray_state(self, stage: str | None = None, countdown: str | None = None) -> None:
+        if stage is None or countdown is None:
+            stage, countdown = self._current_stage_and_countdown()
+        owns_tooltip = self._status_tray is not None and (self._shared_tray is None or self._status_tray_active)
+        state = (stage, countdown, owns_tooltip)
+        # Most calls repeat the last state (several updaters per transition); skip the string work.
+        if state == self._last_tray_state:
+            return
+        self._last_tray_state = state
+        line = self._STAGE_LINE_FMT.format(stage, countdown)
         if self._status_tray_stage_action is not None:
             self._status_tray_stage_action.setText(f"当前环节：{line}")
-        if self._status_tray is not None and (self._shared_tray is None or self._status_tray_active):
-            self._status_tray.setToolTip(f"专注计时器：{line}")
+        if owns_tooltip:
+            self._set_tray_tooltip(self._status_tray, f"专注计时器：{line}")
 
     def _request_chat_window(self) -> None:
         self.chatRequested.emit()
 
     def _load_icon(self, candidates: tuple[str, ...]) -> QIcon | None:
-        icon_dir = self._resources_dir / "icon"
-        for name in candidates:
-            candidate = icon_dir / name
-            if candidate.exists():
-                icon = QIcon(str(candidate))
-                if not icon.isNull():
-                    return icon
-        return None
+        return _load_icon_cached(str(self._resources_dir), candidates)
 
     def _apply_icon_to_button(
         self,
@@ -1882,43 +2118,52 @@ class WithYouWindow(QDialog):
             return
         button.setIcon(icon)
         button.setText("")
+        self._apply_icon_layout_once(button, size)
+
+    @staticmethod
+    def _apply_icon_layout_once(button: QtPushButton, size: int) -> None:
+        """Run apply_icon_button_layout only when the layout parameters changed (it re-polishes)."""
+        key = [size, 14, 30, False]
+        if button.property("_iconLayoutKey") == key and button.property("iconOnly") is True:
+            return
         apply_icon_button_layout(button, icon_size=size, edge_padding=14, min_edge=30, set_fixed=False)
+        button.setProperty("_iconLayoutKey", key)
 
     def _apply_icon_buttons(self) -> None:
         self._apply_icon_to_button(
             self.chat_btn,
             "聊天窗口",
-            ("chat.png", "chat.PNG", "jumpout.png"),
+            CHAT_ICONS,
         )
         self._apply_icon_to_button(
             self.mini_btn,
             "悬浮条",
-            ("exitfull.png", "expand.png", "fullscreen.jpeg"),
+            MINI_ICONS,
         )
         self._apply_icon_to_button(
             self.settings_btn,
             "设置",
-            ("setting.png", "setting.PNG"),
+            SETTING_ICONS,
         )
         self._apply_icon_to_button(
             self.return_btn,
             "返回当前进度",
-            ("return.png", "return.PNG"),
+            RETURN_ICONS,
         )
         self._apply_icon_to_button(
             self.exit_btn,
             "退出",
-            ("exit", "exit.png", "exit.PNG", "exitfull.png"),
+            EXIT_ICONS,
         )
         self._apply_icon_to_button(
             self.note_btn,
             "便利贴",
-            ("post-it.png", "post-it.PNG", "notepad.png", "notepad.PNG"),
+            NOTE_ICONS,
         )
         self._apply_icon_to_button(
             self.skip_btn,
             "跳过当前环节",
-            ("skip.png", "skip.PNG", "next.png", "next.PNG"),
+            SKIP_ICONS,
         )
         self._set_pause_button_state()
 
@@ -1928,19 +2173,19 @@ class WithYouWindow(QDialog):
         self._apply_icon_to_button(
             self._mini_bar.chat_btn,
             "聊天窗口",
-            ("chat.png", "chat.PNG", "jumpout.png"),
+            CHAT_ICONS,
             size=18,
         )
         self._apply_icon_to_button(
             self._mini_bar.expand_btn,
             "展开",
-            ("expand.png", "fullscreen.jpeg"),
+            EXPAND_ICONS,
             size=18,
         )
         self._apply_icon_to_button(
             self._mini_bar.exit_btn,
             "退出",
-            ("exit", "exit.png", "exit.PNG", "exitfull.png"),
+            EXIT_ICONS,
             size=18,
         )
         self._set_pause_button_state()
@@ -1950,46 +2195,41 @@ class WithYouWindow(QDialog):
         if paused:
             tip = "继续"
             text = "继续"
-            icon_names = ("play.png", "play.PNG", "ic_play.png")
+            icon = self._icon_play
         else:
             tip = "暂停"
             text = "暂停"
-            icon_names = ("pause.png", "pause.PNG", "ic_pause.png")
+            icon = self._icon_pause
         button.setToolTip(tip if mini else ("继续计时" if paused else "暂停计时"))
-        icon = self._load_icon(icon_names)
         if icon is None:
             button.setIcon(QIcon())
             button.setProperty("iconOnly", False)
+            button.setProperty("_iconLayoutKey", None)
             button.setText(text)
             return
         button.setIcon(icon)
         button.setText("")
-        apply_icon_button_layout(button, icon_size=icon_size, edge_padding=14, min_edge=30, set_fixed=False)
+        self._apply_icon_layout_once(button, icon_size)
 
     def _set_pause_button_state(self) -> None:
         self._set_pause_button_visual(self.pause_btn, paused=self._is_paused, mini=False)
         if self._mini_bar is not None:
             self._set_pause_button_visual(self._mini_bar.pause_btn, paused=self._is_paused, mini=True)
 
+    def _refresh_chrome(self) -> None:
+        """Pause buttons, mini-bar status and tray after a phase transition; stage computed once."""
+        self._set_pause_button_state()
+        self._apply_stage(*self._current_stage_and_countdown())
+
     def _update_mini_bar_state(self) -> None:
-        if self._mini_bar is None:
-            self._update_status_tray_state()
-            return
-        self._mini_bar.pause_btn.setEnabled(self._phase == "running")
-        if self._phase == "running":
-            if self._is_paused:
-                self._mini_bar.set_status("● 已暂停")
-            elif self._is_break_phase:
-                self._mini_bar.set_status("● 休息中")
-            else:
-                self._mini_bar.set_status("● 专注中")
-        elif self._phase == "config":
-            self._mini_bar.set_status("● 设置中")
-        elif self._phase == "hangup":
-            self._mini_bar.set_status("● 结束中")
-        else:
-            self._mini_bar.set_status("● 通话中")
-        self._update_status_tray_state()
+        self._apply_stage(*self._current_stage_and_countdown())
+
+    def _apply_stage(self, stage: str, countdown: str) -> None:
+        self._last_ui["stage"] = stage
+        if self._mini_bar is not None:
+            self._mini_bar.pause_btn.setEnabled(self._phase == "running")
+            self._mini_bar.set_status_state(f"● {stage}", self._STAGE_MINI_STATE.get(stage, "config"))
+        self._update_status_tray_state(stage, countdown)
 
     def resizeEvent(self, event) -> None:
         super().resizeEvent(event)
@@ -1998,7 +2238,7 @@ class WithYouWindow(QDialog):
             self._ribbon_overlay.setGeometry(self._interactive_page.rect())
             if self._stack.currentWidget() is self._interactive_page:
                 self._sync_ribbon_overlay_stack()
-        self._render_frame()
+        self._resize_render_timer.start()
         self._reposition_audio_popups_if_shown()
 
     def changeEvent(self, event: QEvent) -> None:
@@ -2032,9 +2272,9 @@ class WithYouWindow(QDialog):
         self._reposition_audio_popups_if_shown()
 
     def _reposition_audio_popups_if_shown(self) -> None:
-        if self._noise_popup.isVisible():
+        if self._noise_popup is not None and self._noise_popup.isVisible():
             self._reposition_noise_popup()
-        if self._bgm_popup.isVisible():
+        if self._bgm_popup is not None and self._bgm_popup.isVisible():
             self._reposition_bgm_popup()
 
     def closeEvent(self, event: QCloseEvent) -> None:
@@ -2042,15 +2282,11 @@ class WithYouWindow(QDialog):
         self._tick.stop()
         self._stop_all_playback()
         self._call_active = False
-        if self._mini_bar is not None and self._mini_bar.isVisible():
-            self._mini_bar.close()
+        for window in self._owned_subwindows:
+            if window.isVisible():
+                window.close()
         self._set_status_tray_visible(False)
-        if self._note_window is not None and self._note_window.isVisible():
-            self._note_window.close()
-        if self._noise_popup.isVisible():
-            self._noise_popup.close()
-        if self._bgm_popup.isVisible():
-            self._bgm_popup.close()
+        self._settings_writer.flush()
         if was_call_active:
             self.callEnded.emit()
         super().closeEvent(event)
\ No newline at end of file
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication, QMenu, QSystemTrayIcon  # noqa: E402
+
+from app.with_you.window import WithYouWindow  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+def test_shared_tray_tooltip_restored_after_hide_show(qapp, tmp_path):
+    tray = QSystemTrayIcon()
+    default_menu = QMenu()
+    window = WithYouWindow(
+        tmp_path,
+        shared_tray=tray,
+        shared_tray_default_menu=default_menu,
+        shared_tray_default_tooltip="DEFAULT",
+    )
+    try:
+        window._set_status_tray_visible(True)
+        shown = tray.toolTip()
+        assert shown.startswith("专注计时器：")
+
+        window._set_status_tray_visible(False)
+        assert tray.toolTip() == "DEFAULT"
+        assert tray.contextMenu() is default_menu
+
+        # Same stage and countdown as before the hide: the stage tooltip must still come back.
+        window._set_status_tray_visible(True)
+        assert tray.toolTip() == shown
+        assert tray.contextMenu() is not default_menu
+    finally:
+        window.close()
+        window.deleteLater()